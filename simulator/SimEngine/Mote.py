@@ -29,6 +29,7 @@ log.addHandler(NullHandler())
 
 import copy
 import random
+import collections
 import threading
 import math
 
@@ -54,19 +55,28 @@ DEBUG = 'DEBUG'
 INFO = 'INFO'
 WARNING = 'WARNING'
 ERROR = 'ERROR'
-
-# === app
-APP_TYPE_DATA = 'DATA'
-APP_TYPE_ACK = 'ACK'  # end to end ACK
-APP_TYPE_JOIN = 'JOIN'  # join traffic
-APP_TYPE_FRAG = 'FRAG'
-RPL_TYPE_DIO = 'DIO'
-RPL_TYPE_DAO = 'DAO'
-TSCH_TYPE_EB = 'EB'
+LOG_LEVELS = {
+    DEBUG: logging.DEBUG,
+    INFO: logging.INFO,
+    WARNING: logging.WARNING,
+    ERROR: logging.ERROR,
+}
+
+# keep the per-cell [debug] interference lists, nothing reads them in normal runs
+DEBUG_SCHEDULE = False
+
+# === app (packet types are small ints, compared on every packet)
+APP_TYPE_DATA = 0
+APP_TYPE_ACK = 1  # end to end ACK
+APP_TYPE_FRAG = 2
+APP_TYPE_JOIN = 3  # join traffic
+RPL_TYPE_DIO = 4
+RPL_TYPE_DAO = 5
+TSCH_TYPE_EB = 6
 # === 6top message types
-IANA_6TOP_TYPE_REQUEST = '6TOP_REQUEST'
-IANA_6TOP_TYPE_RESPONSE = '6TOP_RESPONSE'
-IANA_6TOP_TYPE_CONFIRMATION = '6TOP_CONFIRMATION'
+IANA_6TOP_TYPE_REQUEST = 7
+IANA_6TOP_TYPE_RESPONSE = 8
+IANA_6TOP_TYPE_CONFIRMATION = 9
 
 # === rpl
 RPL_PARENT_SWITCH_THRESHOLD        = 768 # corresponds to 1.5 hops. 6tisch minimal draft use 384 for 2*ETX.
@@ -104,6 +114,8 @@ SIX_STATE_REQUEST_ADD_RECEIVED = 0x0e
 SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE = 0x0f
 SIX_STATE_REQUEST_DELETE_RECEIVED = 0x10
 SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE = 0x11
+# response already sent, waiting for SendDone confirmation
+SIX_STATES_WAIT_RESPONSE_SENDDONE = frozenset([SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE, SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE])
 
 # === 6top commands
 IANA_6TOP_CMD_ADD = 0x01  # add one or more cells
@@ -137,6 +149,8 @@ MSF_MAX_OLD_PARENT_REMOVAL = 1 # 1 means one retry
 # === tsch
 TSCH_QUEUE_SIZE = 10
 TSCH_MAXTXRETRIES = 4
+# packet types of which one additional packet can be enqueued when the queue is full
+TSCH_QUEUE_PRIORITY_TYPES = frozenset([APP_TYPE_JOIN, RPL_TYPE_DAO, IANA_6TOP_TYPE_REQUEST, IANA_6TOP_TYPE_RESPONSE])
 # TSCH_MIN_BACKOFF_EXPONENT = 1
 # TSCH_MAX_BACKOFF_EXPONENT = 1
 # === radio
@@ -159,20 +173,164 @@ FRAGMENT_FORWARDING_DEFAULT_MAX_VRB_ENTRY_NUM = 50
 
 BROADCAST_ADDRESS = 0xffff
 
+# === stats
+SHARED_CELL_STAT_KEYS = {}  # (ts, ch) -> (collision, success) stat names, filled on first use by any mote
+MOTESTATS_ZERO = {  # per-cycle mote counters, copied at every reset
+    # app
+    'appGenerated': 0,  # number of packets app layer generated
+    'appRelayed': 0,  # number of packets relayed
+    'appReachesDagroot': 0,  # number of packets received at the DAGroot
+    'droppedFailedEnqueue': 0,  # dropped packets because failed enqueue them
+    'droppedDataFailedEnqueue': 0,  # dropped DATA packets because app failed enqueue them
+    # queue
+    'droppedQueueFull': 0,  # dropped packets because queue is full
+    # rpl
+    'rplTxDIO': 0,  # number of TX'ed DIOs
+    'rplRxDIO': 0,  # number of RX'ed DIOs
+    'rplTxDAO': 0,  # number of TX'ed DAOs
+    'rplRxDAO': 0,  # number of RX'ed DAOs
+    'rplChurnPrefParent': 0,  # number of time the mote changes preferred parent
+    'rplChurnRank': 0,  # number of time the mote changes rank
+    'rplChurnParentSet': 0,  # number of time the mote changes parent set
+    'droppedNoRoute': 0,  # packets dropped because no route (no preferred parent)
+    'droppedNoTxCells': 0,  # packets dropped because no TX cells
+    # 6top
+    '6topTxRelocatedCells': 0,  # number of time tx-triggered 6top relocates a single cell
+    '6topTxRelocatedBundles': 0,  # number of time tx-triggered 6top relocates a bundle
+    '6topRxRelocatedCells': 0,  # number of time rx-triggered 6top relocates a single cell
+    '6topTxAddReq': 0,  # number of 6P Add request transmitted
+    '6topTxAddResp': 0,  # number of 6P Add responses transmitted
+    '6topTxDelReq': 0,  # number of 6P del request transmitted
+    '6topTxDelResp': 0,  # number of 6P del responses transmitted
+    '6topRxAddReq': 0,  # number of 6P Add request received
+    '6topRxAddResp': 0,  # number of 6P Add responses received
+    '6topRxDelReq': 0,  # number of 6P Del request received
+    '6topRxDelResp': 0,  # number of 6P Del responses received
+    # tsch
+    'droppedMacRetries': 0,  # packets dropped because more than TSCH_MAXTXRETRIES MAC retries
+    'droppedDataMacRetries': 0,  # packets dropped because more than TSCH_MAXTXRETRIES MAC retries in a DATA packet
+    'tschTxEB': 0,  # number of TX'ed EBs
+    'tschRxEB': 0,  # number of RX'ed EBs
+}
+
 
 # ============================ body ============================================
 
+class NullLock(object):
+    """ stands in for the mote's RLock when no other thread (GUI) reads its state """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class Cell(object):
+    """ A cell in the schedule of a mote. """
+
+    __slots__ = (
+        'ch',
+        'dir',
+        'neighbor',
+        'numTx',
+        'numTxAck',
+        'numRx',
+        'history',
+        'sharedCellSuccess',
+        'sharedCellCollision',
+        'rxDetectedCollision',
+        'debug_canbeInterfered',
+        'debug_interference',
+        'debug_lockInterference',
+        'debug_cellCreatedAsn',
+        'parentTs',
+        'modulation',
+    )
+
+    def __init__(self, ch, dir, neighbor, createdAsn, parentTs=None, modulation=None):
+        self.ch = ch
+        self.dir = dir
+        self.neighbor = neighbor
+        self.numTx = 0
+        self.numTxAck = 0
+        self.numRx = 0
+        self.history = []
+        self.sharedCellSuccess = 0  # indicator of success for shared cells
+        self.sharedCellCollision = 0  # indicator of a collision for shared cells
+        self.rxDetectedCollision = False
+        if DEBUG_SCHEDULE:
+            self.debug_canbeInterfered = []  # [debug] shows schedule collision that can be interfered with minRssi or larger level
+            self.debug_interference = []  # [debug] shows an interference packet with minRssi or larger level
+            self.debug_lockInterference = []  # [debug] shows locking on the interference packet
+            self.debug_cellCreatedAsn = createdAsn  # [debug]
+        else:
+            self.debug_canbeInterfered = None
+            self.debug_interference = None
+            self.debug_lockInterference = None
+            self.debug_cellCreatedAsn = None
+        self.parentTs = parentTs
+        self.modulation = modulation
+
+
+class SixtopState(object):
+    """ 6top transaction state of a mote towards one neighbor. A direction is unused as long as its state is None. """
+
+    __slots__ = (
+        'txState',
+        'txBlockedCells',
+        'txSeqNum',
+        'txTimeout',
+        'txTimerTag',
+        'txTimerAsn',
+        'rxState',
+        'rxBlockedCells',
+        'rxSeqNum',
+    )
+
+    def __init__(self):
+        self.txState = None
+        self.txBlockedCells = []
+        self.txSeqNum = 0
+        self.txTimeout = None
+        self.txTimerTag = None
+        self.txTimerAsn = None
+        self.rxState = None
+        self.rxBlockedCells = []
+        self.rxSeqNum = 0
+
+    def initTx(self):
+        self.txState = SIX_STATE_IDLE
+        self.txBlockedCells = []
+        self.txSeqNum = 0
+        self.txTimeout = None
+        self.txTimerTag = None
+        self.txTimerAsn = None
+
+    def initRx(self):
+        self.rxState = SIX_STATE_IDLE
+        self.rxBlockedCells = []
+        self.rxSeqNum = 0
+
+
 class Mote(object):
 
     def __init__(self, id):
         # store params
         self.id = id
         # local variables
-        self.dataLock = threading.RLock()
-
         self.engine = SimEngine.SimEngine()
         self.settings = SimSettings.SimSettings()
 
+        # only the GUI reads mote state from another thread
+        self.dataLock = threading.RLock() if self.settings.gui else NullLock()
+
+        # modulation parameters of the configuration in use, looked up on every (bonded) cell
+        self._modulationSlots = Modulation.Modulation().modulationSlots[self.settings.modulationConfig]
+        self._minimalCellModulation = Modulation.Modulation().minimalCellModulation[self.settings.modulationConfig]
+        # to convert the 6top timeouts (s) into a number of slots
+        self._invSlotDuration = 1.0 / self.settings.slotDuration
+
         self.genMSF = random.Random()
         self.genMSF.seed(self.settings.seed + self.id)
         self.geneLLSF = random.Random()
@@ -239,9 +397,13 @@ class Mote(object):
         #                 'blockedCells', candidates cell pending for an operation
 
         # tsch
-        self.txQueue = []
+        self.txQueue = collections.deque()
+        self._txQueueTypeCount = collections.defaultdict(int)  # number of queued packets, indexed by packet type
         self.pktToSend = None
         self.schedule = {}  # indexed by ts, contains cell
+        self._cellsByDir = {DIR_TX: {}, DIR_RX: {}, DIR_TXRX_SHARED: {}}  # same cells as the schedule, split by direction
+        self._numDedicatedCells = 0  # cells in the schedule to a single neighbor mote
+        self._txStatsPerNeigh = collections.defaultdict(lambda: [0, 0])  # [numTx, numTxAck] summed over the cells to a neighbor
         self.waitingFor = None
         self.timeCorrectedSlot = None
         self.isSync = False
@@ -257,7 +419,10 @@ class Mote(object):
         self.drift = self.genEBDIO.uniform(-RADIO_MAXDRIFT, RADIO_MAXDRIFT)
         # wireless
         self.RSSI = {}  # indexed by neighbor
+        self.RSSImW = {}  # same as RSSI, in mW for the SINR computation
         self.PDR = {}  # indexed by neighbor
+        self._myNeighborsCache = None  # neighbors with a positive PDR, rebuilt after the PDRs changed
+        self._myNeighborsSet = None  # same neighbors, for membership tests
         self.initialRSSI = {}
         self.initialPDR = {}
         # location
@@ -294,6 +459,9 @@ class Mote(object):
             self.maxVRBEntryNum = self.settings.maxVRBEntryNum
         else:
             self.maxVRBEntryNum = FRAGMENT_FORWARDING_DEFAULT_MAX_VRB_ENTRY_NUM
+        # optional settings checked per packet, resolved once
+        self.fragmentPackets = hasattr(self.settings, 'numFragments') and self.settings.numFragments > 1
+        self.forwardFragments = bool(getattr(self.settings, 'enableFragmentForwarding', False))
         # stats
         self._stats_resetMoteStats()
         self._stats_resetQueueStats()
@@ -309,7 +477,9 @@ class Mote(object):
         self.pktDropQueue = 0  # DATA packets received during the experiment (without warming up) to Queue full
 
         self.tsSixTopReqRecv = {}  # for every neighbor, it tracks the 6top transaction latency
-        self.avgsixtopLatency = []  # it tracks the average 6P transaction latency in a given frame
+        # it tracks the average 6P transaction latency in a given frame, as a running sum and count
+        self.sixtopLatencySum = 0
+        self.sixtopLatencyNum = 0
         
         self.rplPrefParentChurns = 0
         self.rplPrefParentChurnToAndASN = (None, None)
@@ -358,6 +528,8 @@ class Mote(object):
 
         self.aggregatedSlot = dict()
         self.onGoingReception = False
+        # info of the ongoing (bonded) TX/RX handed to the propagation model, reused for every transmission/reception
+        self._aggregatedInfo = {'startSlot': 0, 'endSlot': 0, 'modulation': None, 'success': True, 'packetSize': self.settings.packetSize, 'interferers': []}
 
         self.distanceTo = dict()
 
@@ -383,8 +555,10 @@ class Mote(object):
         self.dagRoot = True
         self.rank = 0
         self.dagRank = 0
-        self.packetLatencies = []  # in slots
-        self.packetHops = []
+        self.packetLatencySum = 0  # in slots
+        self.packetLatencyNum = 0
+        self.packetHopsSum = 0
+        self.packetHopsNum = 0
         self.parents = {}  # dictionary containing parents of each node from whom DAG root received a DAO
         self.isJoined = True
         self.isSync = True
@@ -416,7 +590,7 @@ class Mote(object):
 
         if not self.isJoined:
             self.isJoined = True
-            self.joinAsn = self.engine.getAsn()
+            self.joinAsn = self.engine.asn
             # log
             self._log(
                 INFO,
@@ -460,7 +634,7 @@ class Mote(object):
         if sourceRoute or not self.dagRoot:
             # create new packet
             newPacket = {
-                'asn': self.engine.getAsn(),
+                'asn': self.engine.asn,
                 'type': APP_TYPE_JOIN,
                 'code': None,
                 'payload': [token, self.id if not self.dagRoot else None,
@@ -515,7 +689,7 @@ class Mote(object):
             self._init_stack()
 
     def join_joinedNeighbors(self):
-        return [nei for nei in self._myNeighbors() if nei.isJoined == True]
+        return [nei for nei in self._myNeighborsShared() if nei.isJoined == True]
 
     # def print_random(self):
     #     self._log(
@@ -648,18 +822,13 @@ class Mote(object):
         assert self.dagRoot
 
         # update mote stats
-        if self.settings.convergeFirst and payload[1] >= self.engine.asnInitExperiment and payload[1] <= self.engine.asnEndExperiment:
+        if not self.settings.convergeFirst or self.engine.asnInitExperiment <= payload[1] <= self.engine.asnEndExperiment:
             self.pktReceived += 1
             if srcIp.id not in self.pktLatencies:
                 self.pktLatencies[srcIp.id] = []
             # print 'timestamp = {0} - payload {1}'.format(timestamp, payload[1])
             # print 'timestamp = {0} - payload {1}'.format(timestamp % self.settings.slotframeLength, payload[1] % self.settings.slotframeLength)
             self.pktLatencies[srcIp.id].append(timestamp - payload[1])
-        elif not self.settings.convergeFirst:
-            self.pktReceived += 1
-            if srcIp.id not in self.pktLatencies:
-                self.pktLatencies[srcIp.id] = []
-            self.pktLatencies[srcIp.id].append(timestamp - payload[1])
         self._stats_incrementMoteStats('appReachesDagroot')
 
         # print 'At root, received packet at ts = %d and ASN = %d with latency = %.4f' % (self.engine.asn % self.settings.slotframeLength, self.engine.asn, timestamp - payload[1])
@@ -687,7 +856,7 @@ class Mote(object):
                 # send an ACK
                 # create new packet
                 newPacket = {
-                    'asn': self.engine.getAsn(),
+                    'asn': self.engine.asn,
                     'type': APP_TYPE_ACK,
                     'code': None,
                     'payload': [],
@@ -713,10 +882,8 @@ class Mote(object):
             (self.preferredParent.id,),
         )
 
-        if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+        if self.engine.countStats:
             self.arrivedToGen += 1  # stat that is not resetted
-        elif not self.settings.convergeFirst:
-            self.arrivedToGen += 1
 
         if self.preferredParent and \
                 (self.settings.sf == 'ilp' or (self.settings.sf != 'ilp' and self.numCellsToNeighbors.get(self.preferredParent, 0) != 0)):
@@ -724,10 +891,10 @@ class Mote(object):
 
             # create new packet
             newPacket = {
-                'asn': self.engine.getAsn(),
+                'asn': self.engine.asn,
                 'type': APP_TYPE_DATA,
                 'code': None,
-                'payload': [self.id, self.engine.getAsn(), 1],
+                'payload': [self.id, self.engine.asn, 1],
             # the payload is used for latency and number of hops calculation
                 'retriesLeft': TSCH_MAXTXRETRIES,
                 'srcIp': self,
@@ -736,14 +903,12 @@ class Mote(object):
             }
 
             # update mote stats
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+            if self.engine.countStats:
                 self.pktGen += 1  # stat that is not resetted
-            elif not self.settings.convergeFirst:
-                self.pktGen += 1
             self._stats_incrementMoteStats('appGenerated')
 
             # enqueue packet in TSCH queue
-            if hasattr(self.settings, 'numFragments') and self.settings.numFragments > 1:
+            if self.fragmentPackets:
                 self._app_frag_packet(newPacket)
             else:
                 # send it as a single frame
@@ -757,21 +922,17 @@ class Mote(object):
                     pass
                 else:
                     # update mote stats
-                    if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                        self.pktDropQueue += 1
-                    elif not self.settings.convergeFirst:
+                    if self.engine.countStats:
                         self.pktDropQueue += 1
                     self._radio_drop_packet(newPacket, 'droppedDataFailedEnqueue')
                     self._log(
                         INFO,
                         "[app] DATA packet dropped. (queue length {0}, {1})",
-                        (len(self.txQueue), str(self.txQueue)),
+                        (len(self.txQueue), list(self.txQueue)),
                     )
         else:
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+            if self.engine.countStats:
                 self.notGenerated += 1  # stat that is not resetted
-            elif not self.settings.convergeFirst:
-                self.notGenerated += 1
 
     def _app_action_enqueueSporadicData(self):
         """ enqueue data packet into stack """
@@ -784,19 +945,17 @@ class Mote(object):
             (self.preferredParent.id,),
         )
 
-        if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+        if self.engine.countStats:
             self.arrivedToGen += 1  # stat that is not resetted
-        elif not self.settings.convergeFirst:
-            self.arrivedToGen += 1
 
         if self.preferredParent and self.numCellsToNeighbors.get(self.preferredParent, 0) != 0:
 
             # create new packet
             newPacket = {
-                'asn': self.engine.getAsn(),
+                'asn': self.engine.asn,
                 'type': APP_TYPE_DATA,
                 'code': None,
-                'payload': [self.id, self.engine.getAsn(), 1],
+                'payload': [self.id, self.engine.asn, 1],
             # the payload is used for latency and number of hops calculation
                 'retriesLeft': TSCH_MAXTXRETRIES,
                 'srcIp': self,
@@ -805,14 +964,12 @@ class Mote(object):
             }
 
             # update mote stats
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+            if self.engine.countStats:
                 self.pktGen += 1  # stat that is not resetted
-            elif not self.settings.convergeFirst:
-                self.pktGen += 1
             self._stats_incrementMoteStats('appGenerated')
 
             # enqueue packet in TSCH queue
-            if hasattr(self.settings, 'numFragments') and self.settings.numFragments > 1:
+            if self.fragmentPackets:
                 self._app_frag_packet(newPacket)
             else:
                 # send it as a single frame
@@ -826,21 +983,17 @@ class Mote(object):
                     pass
                 else:
                     # update mote stats
-                    if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                        self.pktDropQueue += 1
-                    elif not self.settings.convergeFirst:
+                    if self.engine.countStats:
                         self.pktDropQueue += 1
                     self._radio_drop_packet(newPacket, 'droppedDataFailedEnqueue')
                     self._log(
                         INFO,
                         "[app] SPORADIC DATA packet dropped. (queue length {0}, {1})",
-                        (len(self.txQueue), str(self.txQueue)),
+                        (len(self.txQueue), list(self.txQueue)),
                     )
         else:
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+            if self.engine.countStats:
                 self.notGenerated += 1  # stat that is not resetted
-            elif not self.settings.convergeFirst:
-                self.notGenerated += 1
 
 
     def _app_is_frag_to_forward(self, frag):
@@ -854,7 +1007,7 @@ class Mote(object):
 
         for mac in self.vrbTable.keys():
             for tag in self.vrbTable[mac].keys():
-                if (self.engine.getAsn() - self.vrbTable[mac][tag]['ts']) > entry_lifetime:
+                if (self.engine.asn - self.vrbTable[mac][tag]['ts']) > entry_lifetime:
                     del self.vrbTable[mac][tag]
             if len(self.vrbTable[mac]) == 0:
                 del self.vrbTable[mac]
@@ -888,7 +1041,7 @@ class Mote(object):
             else:
                 self.vrbTable[smac][itag]['otag'] = self.next_datagram_tag
                 self.next_datagram_tag = (self.next_datagram_tag + 1) % 65536
-            self.vrbTable[smac][itag]['ts'] = self.engine.getAsn()
+            self.vrbTable[smac][itag]['ts'] = self.engine.asn
 
             if (hasattr(self.settings, 'optFragmentForwarding') and
                     (self.settings.optFragmentForwarding is not None) and
@@ -909,7 +1062,7 @@ class Mote(object):
                     self._radio_drop_packet(frag, 'droppedFragMissingFrag')
                     return False
 
-            frag['asn'] = self.engine.getAsn()
+            frag['asn'] = self.engine.asn
             frag['payload'][2] += 1  # update the number of hops
             frag['payload'][3]['datagram_tag'] = self.vrbTable[smac][itag]['otag']
         else:
@@ -934,11 +1087,11 @@ class Mote(object):
         for i in range(0, self.settings.numFragments):
             frag = copy.copy(packet)
             frag['type'] = APP_TYPE_FRAG
-            frag['payload'] = copy.deepcopy(packet['payload'])
+            frag['payload'] = list(packet['payload'])
             frag['payload'].append({'datagram_size': self.settings.numFragments,
                                     'datagram_tag': tag,
                                     'datagram_offset': i})
-            frag['sourceRoute'] = copy.deepcopy(packet['sourceRoute'])
+            frag['sourceRoute'] = list(packet['sourceRoute'])
             if not self._tsch_enqueue(frag):
                 # we may want to stop fragmentation here. but just continue it
                 # for simplicity
@@ -954,7 +1107,7 @@ class Mote(object):
             # remove expired entry
             for s in list(self.reassQueue):
                 for t in list(self.reassQueue[s]):
-                    if (self.engine.getAsn() - self.reassQueue[s][t]['ts']) > reass_queue_lifetime:
+                    if (self.engine.asn - self.reassQueue[s][t]['ts']) > reass_queue_lifetime:
                         del self.reassQueue[s][t]
                     if len(self.reassQueue[s]) == 0:
                         del self.reassQueue[s]
@@ -980,7 +1133,7 @@ class Mote(object):
         if smac not in self.reassQueue:
             self.reassQueue[smac] = {}
         if tag not in self.reassQueue[smac]:
-            self.reassQueue[smac][tag] = {'ts': self.engine.getAsn(), 'fragments': []}
+            self.reassQueue[smac][tag] = {'ts': self.engine.asn, 'fragments': []}
 
         if offset not in self.reassQueue[smac][tag]['fragments']:
             self.reassQueue[smac][tag]['fragments'].append(offset)
@@ -1005,7 +1158,7 @@ class Mote(object):
 
             # create new packet
             newPacket = {
-                'asn': self.engine.getAsn(),
+                'asn': self.engine.asn,
                 'type': TSCH_TYPE_EB,
                 'code': None,
                 'payload': [self.dagRank],  # the payload is the rpl rank
@@ -1028,7 +1181,7 @@ class Mote(object):
 
         with self.dataLock:
 
-            asn = self.engine.getAsn()
+            asn = self.engine.asn
 
             if self.settings.bayesianBroadcast:
                 futureAsn = int(self.settings.slotframeLength)
@@ -1082,16 +1235,14 @@ class Mote(object):
                 "[tsch] synced on EB received from mote {0}.",
                 (smac.id,),
             )
-            self.firstBeaconAsn = self.engine.getAsn()
+            self.firstBeaconAsn = self.engine.asn
             self.firstEB = False
             # declare as synced to the network
             self.isSync = True
             # set neighbors variables before starting request cells to the preferred parent
             # for m in self._myNeighbors():
             #     self._tsch_resetBackoffPerNeigh(m)
-            for m in self.engine.motes:
-                if m.id != self.id:
-                    self._tsch_resetBackoffPerNeigh(m)
+            self._tsch_resetBackoffAllNeighbors()
 
             # add the minimal cell to the schedule
             self._tsch_add_minimal_cell()
@@ -1113,7 +1264,7 @@ class Mote(object):
 
                 # create new packet
                 newPacket = {
-                    'asn': self.engine.getAsn(),
+                    'asn': self.engine.asn,
                     'type': RPL_TYPE_DIO,
                     'code': None,
                     'payload': [self.rank],  # the payload is the rpl rank
@@ -1133,7 +1284,7 @@ class Mote(object):
 
                 # create new packet
                 newPacket = {
-                    'asn': self.engine.getAsn(),
+                    'asn': self.engine.asn,
                     'type': RPL_TYPE_DIO,
                     'code': None,
                     'payload': [self.rank],  # the payload is the rpl rank
@@ -1158,14 +1309,12 @@ class Mote(object):
             # for the ILP SF, you can have no cell to your parent and still enqueue. It will be dropped.
             self._stats_incrementMoteStats('rplTxDAO')
 
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                self.initiatedDAO += 1
-            elif not self.settings.convergeFirst:
+            if self.engine.countStats:
                 self.initiatedDAO += 1
 
             # create new packet
             newPacket = {
-                'asn': self.engine.getAsn(),
+                'asn': self.engine.asn,
                 'type': RPL_TYPE_DAO,
                 'code': None,
                 'payload': [self.id, self.preferredParent.id],
@@ -1188,7 +1337,7 @@ class Mote(object):
 
         with self.dataLock:
 
-            asn = self.engine.getAsn()
+            asn = self.engine.asn
 
             if self.settings.bayesianBroadcast:
                 futureAsn = int(self.settings.slotframeLength)
@@ -1213,7 +1362,7 @@ class Mote(object):
 
         with self.dataLock:
 
-            asn = self.engine.getAsn()
+            asn = self.engine.asn
 
             if not firstDAO:
                 futureAsn = int(math.ceil(
@@ -1267,7 +1416,7 @@ class Mote(object):
 
             # update time correction
             if self.preferredParent == sender:
-                asn = self.engine.getAsn()
+                asn = self.engine.asn
                 self.timeCorrectedSlot = asn
 
     def _rpl_action_receiveDAO(self, type, smac, payload):
@@ -1277,9 +1426,7 @@ class Mote(object):
 
             self._stats_incrementMoteStats('rplRxDAO')
 
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                self.receivedDAO += 1
-            elif not self.settings.convergeFirst:
+            if self.engine.countStats:
                 self.receivedDAO += 1
 
             self.parents.update({tuple([payload[0]]): [[payload[1]]]})
@@ -1512,13 +1659,15 @@ class Mote(object):
             nextHop = [self.preferredParent]
         elif packet['sourceRoute']:  # downward packet with source route info filled correctly
             nextHopId = packet['sourceRoute'].pop()
-            for nei in self._myNeighbors(): # mobility: OK.
+            for nei in self._myNeighborsShared(): # mobility: OK.
                 if [nei.id] == nextHopId:
                     nextHop = [nei]
-        elif packet['dstIp'] in self._myNeighbors():  # mobility: OK. Used for 1hop packets, such as 6top messages. This has to be the last one, since some neighbours can have very low PDR
+        elif self._isMyNeighbor(packet['dstIp']):  # mobility: OK. Used for 1hop packets, such as 6top messages. This has to be the last one, since some neighbours can have very low PDR
             nextHop = [packet['dstIp']]
 
         packet['nextHop'] = nextHop
+        # the single next hop of a unicast packet, compared by identity against the neighbor of a dedicated cell
+        packet['nextHop0'] = nextHop[0] if nextHop and len(nextHop) == 1 else None
         return True if nextHop else False
 
     # ===== msf
@@ -1633,7 +1782,7 @@ class Mote(object):
         """
         cellPDR = []
         for (ts, cell) in self.schedule.iteritems():
-            if (cell['neighbor'] == neighbor and cell['dir'] == DIR_TX) or (cell['dir'] == DIR_TXRX_SHARED and cell['neighbor'] == neighbor):
+            if (cell.neighbor == neighbor and cell.dir == DIR_TX) or (cell.dir == DIR_TXRX_SHARED and cell.neighbor == neighbor):
                 cellPDR.append(self.getCellPDR(cell))
 
         self._log(INFO, '[sixtop] timeout() cellPDR = {0}', (cellPDR,))
@@ -1766,11 +1915,11 @@ class Mote(object):
     def _sixtop_timer_fired(self):
         found = False
         for n in self.sixtopStates.keys():
-            if 'tx' in self.sixtopStates[n] and 'timer' in self.sixtopStates[n]['tx'] and \
-                    self.sixtopStates[n]['tx']['timer']['asn'] == self.engine.getAsn():  # if it is this ASN, we have the correct state and we have to abort it
-                self.sixtopStates[n]['tx']['state'] = SIX_STATE_IDLE  # put back to IDLE
-                self.sixtopStates[n]['tx']['blockedCells'] = []  # transaction gets aborted, so also delete the blocked cells
-                del self.sixtopStates[n]['tx']['timer']
+            if self.sixtopStates[n].txTimerAsn == self.engine.asn:  # if it is this ASN, we have the correct state and we have to abort it
+                self.sixtopStates[n].txState = SIX_STATE_IDLE  # put back to IDLE
+                self.sixtopStates[n].txBlockedCells = []  # transaction gets aborted, so also delete the blocked cells
+                self.sixtopStates[n].txTimerTag = None
+                self.sixtopStates[n].txTimerAsn = None
                 found = True
                 # log
                 self._log(
@@ -1788,8 +1937,8 @@ class Mote(object):
         with self.dataLock:
             if self.settings.sixtopMessaging:
                 if neighbor.id not in self.sixtopStates or \
-                        (neighbor.id in self.sixtopStates and 'tx' not in self.sixtopStates[neighbor.id] and self.sixtopStates[neighbor.id]['rx']['state'] == SIX_STATE_IDLE) or \
-                        (neighbor.id in self.sixtopStates and 'tx' in self.sixtopStates[neighbor.id] and self.sixtopStates[neighbor.id]['tx']['state'] == SIX_STATE_IDLE):
+                        (neighbor.id in self.sixtopStates and self.sixtopStates[neighbor.id].txState is None and self.sixtopStates[neighbor.id].rxState == SIX_STATE_IDLE) or \
+                        (neighbor.id in self.sixtopStates and self.sixtopStates[neighbor.id].txState == SIX_STATE_IDLE):
 
                     self._log(
                         INFO,
@@ -1798,23 +1947,20 @@ class Mote(object):
 
                     # if neighbor not yet in states dict, add it
                     if neighbor.id not in self.sixtopStates:
-                        self.sixtopStates[neighbor.id] = {}
-                    if 'tx' not in self.sixtopStates[neighbor.id]:
-                        self.sixtopStates[neighbor.id]['tx'] = {}
-                        self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                        self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
-                        self.sixtopStates[neighbor.id]['tx']['seqNum'] = 0
-                    self.sixtopStates[neighbor.id]['tx']['timeout'] = timeout
+                        self.sixtopStates[neighbor.id] = SixtopState()
+                    if self.sixtopStates[neighbor.id].txState is None:
+                        self.sixtopStates[neighbor.id].initTx()
+                    self.sixtopStates[neighbor.id].txTimeout = timeout
 
                     if self.eLLSF is None:  # do normal 6top reservation
                         # get blocked cells from other 6top operations
                         blockedCells = []
                         for n in self.sixtopStates.keys():
                             if n != neighbor.id:
-                                if 'tx' in self.sixtopStates[n] and len(self.sixtopStates[n]['tx']['blockedCells']) > 0:
-                                    blockedCells += self.sixtopStates[n]['tx']['blockedCells']
-                                if 'rx' in self.sixtopStates[n] and len(self.sixtopStates[n]['rx']['blockedCells']) > 0:
-                                    blockedCells += self.sixtopStates[n]['rx']['blockedCells']
+                                if len(self.sixtopStates[n].txBlockedCells) > 0:
+                                    blockedCells += self.sixtopStates[n].txBlockedCells
+                                if len(self.sixtopStates[n].rxBlockedCells) > 0:
+                                    blockedCells += self.sixtopStates[n].rxBlockedCells
 
                         # convert blocked cells into ts
                         tsBlocked = []
@@ -1835,7 +1981,7 @@ class Mote(object):
                                 s = availableTimeslots[indexInAvailableSlots]
                                 allFree = True
                                 necessarySlots = []
-                                for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                                for i in range(self._modulationSlots[self.modulation[neighbor]]):
                                     necessarySlots += [s + i]
                                 for nSlot in necessarySlots:
                                     if nSlot not in availableTimeslots:
@@ -1849,7 +1995,7 @@ class Mote(object):
                             cellList = [(ts, ch, dir) for (ts, ch) in cells.iteritems()]
 
                         self._sixtop_enqueue_ADD_REQUEST(neighbor, cellList, numCells, dir,
-                                                         self.sixtopStates[neighbor.id]['tx']['seqNum'])
+                                                         self.sixtopStates[neighbor.id].txSeqNum)
                     elif self.eLLSF is not None:
                         self._log(
                             DEBUG,
@@ -1864,12 +2010,12 @@ class Mote(object):
                         )
                         if cellList != []:  # only send the request if we found (an) appropriate cell(s)
                             self._sixtop_enqueue_ADD_REQUEST(neighbor, cellList, numCells, dir,
-                                                             self.sixtopStates[neighbor.id]['tx']['seqNum'])
+                                                             self.sixtopStates[neighbor.id].txSeqNum)
                 else:
                     self._log(
                         DEBUG,
                         "[6top] can not send 6top ADD request to {0} because timer still did not fire on mote {1} to mote {2}: {3}",
-                        (neighbor.id, self.id, neighbor.id, self.sixtopStates[neighbor.id]['tx']['timeout']),
+                        (neighbor.id, self.id, neighbor.id, self.sixtopStates[neighbor.id].txTimeout),
                     )
 
             else:
@@ -1922,10 +2068,10 @@ class Mote(object):
 
         # create new packet
         newPacket = {
-            'asn': self.engine.getAsn(),
+            'asn': self.engine.asn,
             'type': IANA_6TOP_TYPE_REQUEST,
             'code': IANA_6TOP_CMD_ADD,
-            'payload': [cellList, numCells, dir, seq, self.engine.getAsn()],
+            'payload': [cellList, numCells, dir, seq, self.engine.asn],
             'retriesLeft': TSCH_MAXTXRETRIES,
             'srcIp': self,
             'dstIp': neighbor,  # currently upstream
@@ -1953,19 +2099,19 @@ class Mote(object):
                 blockedCellList = []
                 addedBlocked = []
                 for idx, c in enumerate(cellList):
-                    for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                    for i in range(self._modulationSlots[self.modulation[neighbor]]):
                         tmpCell = [(cellList[idx][0] + i, cellList[idx][1], cellList[idx][2])]
                         tmpTs = cellList[idx][0] + i
                         if tmpTs not in addedBlocked:
                             blockedCellList += tmpCell
                             addedBlocked += [tmpTs]
                 # set state to sending request for this neighbor
-                self.sixtopStates[neighbor.id]['tx']['blockedCells'] = blockedCellList
+                self.sixtopStates[neighbor.id].txBlockedCells = blockedCellList
             else:
-                self.sixtopStates[neighbor.id]['tx']['blockedCells'] = cellList
+                self.sixtopStates[neighbor.id].txBlockedCells = cellList
 
             # set state to sending request for this neighbor
-            self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_SENDING_REQUEST
+            self.sixtopStates[neighbor.id].txState = SIX_STATE_SENDING_REQUEST
 
     def _sixtop_receive_ADD_REQUEST(self, type, smac, payload):
         with self.dataLock:
@@ -1979,11 +2125,10 @@ class Mote(object):
             self.tsSixTopReqRecv[neighbor] = payload[4]
             self._stats_incrementMoteStats('6topRxAddReq')
 
-            if smac.id in self.sixtopStates and 'rx' in self.sixtopStates[smac.id] and self.sixtopStates[smac.id]['rx'][
-                'state'] != SIX_STATE_IDLE:
-                for pkt in self.txQueue:
+            if smac.id in self.sixtopStates and self.sixtopStates[smac.id].rxState not in (None, SIX_STATE_IDLE):
+                for pkt in list(self.txQueue):
                     if pkt['type'] == IANA_6TOP_TYPE_RESPONSE and pkt['dstIp'].id == smac.id:
-                        self.txQueue.remove(pkt)
+                        self._tsch_removeFromQueue(pkt)
                         self._log(
                             INFO,
                             "[6top] removed a 6TOP_TYPE_RESPONSE packet (seqNum = {0}) in the queue of mote {1} to neighbor {2}, because a new TYPE_REQUEST (add, seqNum = {3}) was received.",
@@ -1992,12 +2137,10 @@ class Mote(object):
                         # assert False
                 returnCode = IANA_6TOP_RC_RESET  # error, neighbor has to abort transaction
                 if smac.id not in self.sixtopStates:
-                    self.sixtopStates[smac.id] = {}
-                if 'rx' not in self.sixtopStates[smac.id]:
-                    self.sixtopStates[smac.id]['rx'] = {}
-                    self.sixtopStates[smac.id]['rx']['blockedCells'] = []
-                    self.sixtopStates[smac.id]['rx']['seqNum'] = 0
-                self.sixtopStates[smac.id]['rx']['state'] = SIX_STATE_REQUEST_ADD_RECEIVED
+                    self.sixtopStates[smac.id] = SixtopState()
+                if self.sixtopStates[smac.id].rxState is None:
+                    self.sixtopStates[smac.id].initRx()
+                self.sixtopStates[smac.id].rxState = SIX_STATE_REQUEST_ADD_RECEIVED
                 self._sixtop_enqueue_RESPONSE(neighbor, [], returnCode, dirNeighbor, seq)
 
                 return
@@ -2005,13 +2148,11 @@ class Mote(object):
             # go to the correct state
             # set state to receiving request for this neighbor
             if smac.id not in self.sixtopStates:
-                self.sixtopStates[smac.id] = {}
-            if 'rx' not in self.sixtopStates[smac.id]:
-                self.sixtopStates[smac.id]['rx'] = {}
-                self.sixtopStates[smac.id]['rx']['blockedCells'] = []
-                self.sixtopStates[smac.id]['rx']['seqNum'] = 0
+                self.sixtopStates[smac.id] = SixtopState()
+            if self.sixtopStates[smac.id].rxState is None:
+                self.sixtopStates[smac.id].initRx()
 
-            self.sixtopStates[smac.id]['rx']['state'] = SIX_STATE_REQUEST_ADD_RECEIVED
+            self.sixtopStates[smac.id].rxState = SIX_STATE_REQUEST_ADD_RECEIVED
 
             # set direction of cells
             if dirNeighbor == DIR_TX:
@@ -2029,10 +2170,10 @@ class Mote(object):
                 blockedCells = []
                 for n in self.sixtopStates.keys():
                     if n != neighbor.id:
-                        if 'rx' in self.sixtopStates[n] and len(self.sixtopStates[n]['rx']['blockedCells']) > 0:
-                            blockedCells += self.sixtopStates[n]['rx']['blockedCells']
-                        if 'tx' in self.sixtopStates[n] and len(self.sixtopStates[n]['tx']['blockedCells']) > 0:
-                            blockedCells += self.sixtopStates[n]['tx']['blockedCells']
+                        if len(self.sixtopStates[n].rxBlockedCells) > 0:
+                            blockedCells += self.sixtopStates[n].rxBlockedCells
+                        if len(self.sixtopStates[n].txBlockedCells) > 0:
+                            blockedCells += self.sixtopStates[n].txBlockedCells
                 # convert blocked cells into ts
                 tsBlocked = []
                 if len(blockedCells) > 0:
@@ -2050,7 +2191,7 @@ class Mote(object):
                             break
                         s = ts
                         allFree = True
-                        for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                        for i in range(self._modulationSlots[self.modulation[neighbor]]):
                             tmpTs = s + i
                             if tmpTs not in availableTimeslots:
                                 allFree = False
@@ -2074,7 +2215,7 @@ class Mote(object):
                     blockedCellList = []
                     addedBlocked = []
                     for idx, c in enumerate(newCellList):
-                        for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                        for i in range(self._modulationSlots[self.modulation[neighbor]]):
                             tmpCell = [(newCellList[idx][0] + i, newCellList[idx][1], newCellList[idx][2])]
                             tmpTs = newCellList[idx][0] + i
                             if tmpTs not in addedBlocked:
@@ -2083,10 +2224,10 @@ class Mote(object):
                             else:
                                 assert False
                     # set blockCells for this 6top operation
-                    self.sixtopStates[neighbor.id]['rx']['blockedCells'] = blockedCellList
+                    self.sixtopStates[neighbor.id].rxBlockedCells = blockedCellList
                 else:
                     # set blockCells for this 6top operation
-                    self.sixtopStates[neighbor.id]['rx']['blockedCells'] = newCellList
+                    self.sixtopStates[neighbor.id].rxBlockedCells = newCellList
 
                 # enqueue response
                 self._sixtop_enqueue_RESPONSE(neighbor, newCellList, returnCode, newDir, seq)
@@ -2154,7 +2295,7 @@ class Mote(object):
 
         # create new packet
         newPacket = {
-            'asn': self.engine.getAsn(),
+            'asn': self.engine.asn,
             'type': IANA_6TOP_TYPE_RESPONSE,
             'code': returnCode,
             'payload': [cellList, len(cellList), dir, seq],
@@ -2174,7 +2315,7 @@ class Mote(object):
         """ receive a 6P response messages """
 
         with self.dataLock:
-            if self.sixtopStates[smac.id]['tx']['state'] == SIX_STATE_WAIT_ADDRESPONSE:
+            if self.sixtopStates[smac.id].txState == SIX_STATE_WAIT_ADDRESPONSE:
                 # TODO: now this is still an assert, later this should be handled appropriately
                 assert code == IANA_6TOP_RC_SUCCESS or code == IANA_6TOP_RC_NORES or code == IANA_6TOP_RC_RESET  # RC_BUSY not implemented yet
 
@@ -2187,7 +2328,7 @@ class Mote(object):
                 seq = payload[3]
 
                 # seqNum mismatch, transaction failed, ignore packet
-                if seq != self.sixtopStates[neighbor.id]['tx']['seqNum']:
+                if seq != self.sixtopStates[neighbor.id].txSeqNum:
                     # log
                     self._log(
                         INFO,
@@ -2195,13 +2336,13 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return False
 
                 # transaction is considered as failed since the timeout has already scheduled for this ASN. Too late for removing the event, ignore packet
-                if self.sixtopStates[neighbor.id]['tx']['timer']['asn'] == self.engine.getAsn():
+                if self.sixtopStates[neighbor.id].txTimerAsn == self.engine.asn:
                     # log
                     self._log(
                         INFO,
@@ -2209,8 +2350,8 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return False
 
@@ -2222,11 +2363,12 @@ class Mote(object):
                 self._log(
                     INFO,
                     "[6top] removed timer for mote {0} to neighbor {1} on asn {2}, tag {3}",
-                    (self.id, neighbor.id, self.sixtopStates[neighbor.id]['tx']['timer']['asn'], str(uniqueTag)),
+                    (self.id, neighbor.id, self.sixtopStates[neighbor.id].txTimerAsn, str(uniqueTag)),
                 )
-                del self.sixtopStates[neighbor.id]['tx']['timer']
+                self.sixtopStates[neighbor.id].txTimerTag = None
+                self.sixtopStates[neighbor.id].txTimerAsn = None
 
-                self.sixtopStates[smac.id]['tx']['seqNum'] += 1
+                self.sixtopStates[smac.id].txSeqNum += 1
 
                 # if the request was successfull and there were enough resources
                 if code == IANA_6TOP_RC_SUCCESS:
@@ -2263,7 +2405,7 @@ class Mote(object):
                                 '[6top] add {4} cell ts={0},ch={1} from {2} to {3}',
                                 (ts, ch, self.id, neighbor.id, newDir),
                             )
-                            for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                            for i in range(self._modulationSlots[self.modulation[neighbor]]):
                                 cellList += [(ts + i, ch, newDir)]
                                 self._log(
                                     INFO,
@@ -2286,13 +2428,13 @@ class Mote(object):
                     if self.settings.convergeFirst and not self.isConverged and len(receivedCellList) > 0 \
                         and neighbor == self.preferredParent and (newDir == DIR_TX or newDir == DIR_TXRX_SHARED):
                         self.isConverged = True
-                        self.isConvergedASN = self.engine.getAsn()
+                        self.isConvergedASN = self.engine.asn
                         if all(mote.isConverged == True for mote in self.engine.motes):
                             self._log(
                                 INFO,
                                 'All motes converged: all have a cell to their parent.'
                             )
-                            self.engine.dedicatedCellConvergence = self.engine.getAsn()
+                            self.engine.dedicatedCellConvergence = self.engine.asn
                             # experiment time in ASNs
                             simTime = self.settings.numCyclesPerRun * self.settings.slotframeLength
                             # offset until the end of the current cycle
@@ -2334,8 +2476,8 @@ class Mote(object):
                         self.numCellsFromNeighbors[neighbor] += len(receivedCellList)
 
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return True
                 elif code == IANA_6TOP_RC_NORES:
@@ -2346,8 +2488,8 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return True
                     # TODO: increase stats of RC_NORES
@@ -2360,8 +2502,8 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return True
                     # TODO: increase stats of RC_BUSY
@@ -2373,15 +2515,15 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return True
                     # TODO: increase stats of RC_BUSY
                 else:
                     assert False
 
-            elif self.sixtopStates[smac.id]['tx']['state'] == SIX_STATE_WAIT_DELETERESPONSE:
+            elif self.sixtopStates[smac.id].txState == SIX_STATE_WAIT_DELETERESPONSE:
                 # TODO: now this is still an assert, later this should be handled appropriately
                 assert code == IANA_6TOP_RC_SUCCESS or code == IANA_6TOP_RC_NORES or code == IANA_6TOP_RC_RESET
 
@@ -2394,7 +2536,7 @@ class Mote(object):
                 seq = payload[3]
 
                 # seqNum mismatch, transaction failed, ignore packet
-                if seq != self.sixtopStates[neighbor.id]['tx']['seqNum']:
+                if seq != self.sixtopStates[neighbor.id].txSeqNum:
                     # log
                     self._log(
                         INFO,
@@ -2402,13 +2544,13 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return False
 
                 # transaction is considered as failed since the timeout has already scheduled for this ASN. Too late for removing the event, ignore packet
-                if self.sixtopStates[neighbor.id]['tx']['timer']['asn'] == self.engine.getAsn():
+                if self.sixtopStates[neighbor.id].txTimerAsn == self.engine.asn:
                     # log
                     self._log(
                         INFO,
@@ -2416,8 +2558,8 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return False
 
@@ -2429,11 +2571,12 @@ class Mote(object):
                 self._log(
                     INFO,
                     "[6top] removed timer for mote {0} to neighbor {1} on asn {2}, tag {3}",
-                    (self.id, neighbor.id, self.sixtopStates[neighbor.id]['tx']['timer']['asn'], str(uniqueTag)),
+                    (self.id, neighbor.id, self.sixtopStates[neighbor.id].txTimerAsn, str(uniqueTag)),
                 )
-                del self.sixtopStates[neighbor.id]['tx']['timer']
+                self.sixtopStates[neighbor.id].txTimerTag = None
+                self.sixtopStates[neighbor.id].txTimerAsn = None
 
-                self.sixtopStates[smac.id]['tx']['seqNum'] += 1
+                self.sixtopStates[smac.id].txSeqNum += 1
 
                 # if the request was successfull and there were enough resources
                 if code == IANA_6TOP_RC_SUCCESS:
@@ -2456,7 +2599,7 @@ class Mote(object):
                                 '[6top] Delete {3} cell ts={0} from {1} to {2}',
                                 (ts, self.id, neighbor.id, newDir),
                             )
-                            for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                            for i in range(self._modulationSlots[self.modulation[neighbor]]):
                                 toDeleteReceivedCellList += [ts + i]
 
                         self._tsch_removeCells(neighbor, toDeleteReceivedCellList)
@@ -2486,8 +2629,8 @@ class Mote(object):
                         assert self.numCellsFromNeighbors[neighbor] >= 0
 
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
                     return True
                 elif code == IANA_6TOP_RC_NORES:
                     # log
@@ -2497,8 +2640,8 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return True
                     # TODO: increase stats of RC_NORES
@@ -2511,8 +2654,8 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     return True
                     # TODO: increase stats of RC_BUSY
@@ -2524,8 +2667,8 @@ class Mote(object):
                         (neighbor.id, self.id),
                     )
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                    self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
+                    self.sixtopStates[neighbor.id].txState = SIX_STATE_IDLE
+                    self.sixtopStates[neighbor.id].txBlockedCells = []
 
                     # TODO: increase stats of RC_RESET
                     return True
@@ -2540,7 +2683,7 @@ class Mote(object):
     def _sixtop_receive_RESPONSE_ACK(self, packet):
         with self.dataLock:
 
-            if self.sixtopStates[packet['dstIp'].id]['rx']['state'] == SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE:
+            if self.sixtopStates[packet['dstIp'].id].rxState == SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE:
 
                 confirmedCellList = packet['payload'][0]
                 receivedDir = packet['payload'][2]
@@ -2567,7 +2710,7 @@ class Mote(object):
                                 (ts, ch, self.id, neighbor.id, cellDir),
                             )
                             # TODO save the modulation somewhere and not take it in a godlike manner!
-                            for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                            for i in range(self._modulationSlots[self.modulation[neighbor]]):
                                 cellList += [(ts + i, ch, cellDir)]
                                 self._log(
                                     INFO,
@@ -2604,11 +2747,11 @@ class Mote(object):
 
                 # go back to IDLE, i.e. remove the neighbor form the states
                 # but if the node received another, already new request, from the same node (because its timer fired), do not go to IDLE
-                self.sixtopStates[neighbor.id]['rx']['state'] = SIX_STATE_IDLE
-                self.sixtopStates[neighbor.id]['rx']['blockedCells'] = []
-                self.sixtopStates[neighbor.id]['rx']['seqNum'] += 1
+                self.sixtopStates[neighbor.id].rxState = SIX_STATE_IDLE
+                self.sixtopStates[neighbor.id].rxBlockedCells = []
+                self.sixtopStates[neighbor.id].rxSeqNum += 1
 
-            elif self.sixtopStates[packet['dstIp'].id]['rx']['state'] == SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE:
+            elif self.sixtopStates[packet['dstIp'].id].rxState == SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE:
 
                 confirmedCellList = packet['payload'][0]
                 receivedDir = packet['payload'][2]
@@ -2629,7 +2772,7 @@ class Mote(object):
                                 '[6top] delete {3} cell ts={0} from {1} to {2}',
                                 (ts, self.id, neighbor.id, receivedDir),
                             )
-                            for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][self.modulation[neighbor]]):
+                            for i in range(self._modulationSlots[self.modulation[neighbor]]):
                                 toDeleteReceivedCellList += [ts + i]
 
                         self._tsch_removeCells(neighbor, toDeleteReceivedCellList)
@@ -2660,9 +2803,9 @@ class Mote(object):
                     # assert self.numCellsFromNeighbors[neighbor] >= 0
 
                 # go back to IDLE, i.e. remove the neighbor form the states
-                self.sixtopStates[neighbor.id]['rx']['state'] = SIX_STATE_IDLE
-                self.sixtopStates[neighbor.id]['rx']['blockedCells'] = []
-                self.sixtopStates[neighbor.id]['rx']['seqNum'] += 1
+                self.sixtopStates[neighbor.id].rxState = SIX_STATE_IDLE
+                self.sixtopStates[neighbor.id].rxBlockedCells = []
+                self.sixtopStates[neighbor.id].rxSeqNum += 1
 
             else:
                 # only add and delete are implemented so far
@@ -2672,21 +2815,16 @@ class Mote(object):
         with self.dataLock:
             if self.settings.sixtopMessaging:
                 if neighbor.id not in self.sixtopStates or (
-                        neighbor.id in self.sixtopStates and 'tx' in self.sixtopStates[neighbor.id] and
-                        self.sixtopStates[neighbor.id]['tx']['state'] == SIX_STATE_IDLE):
+                        neighbor.id in self.sixtopStates and self.sixtopStates[neighbor.id].txState == SIX_STATE_IDLE):
 
                     # if neighbor not yet in states dict, add it
                     if neighbor.id not in self.sixtopStates:
-                        self.sixtopStates[neighbor.id] = {}
-                    if 'tx' not in self.sixtopStates:
-                        self.sixtopStates[neighbor.id]['tx'] = {}
-                        self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_IDLE
-                        self.sixtopStates[neighbor.id]['tx']['blockedCells'] = []
-                        self.sixtopStates[neighbor.id]['tx']['seqNum'] = 0
-                    self.sixtopStates[neighbor.id]['tx']['timeout'] = timeout
+                        self.sixtopStates[neighbor.id] = SixtopState()
+                    self.sixtopStates[neighbor.id].initTx()
+                    self.sixtopStates[neighbor.id].txTimeout = timeout
 
                     self._sixtop_enqueue_DELETE_REQUEST(neighbor, tsList, len(tsList), dir,
-                                                        self.sixtopStates[neighbor.id]['tx']['seqNum'])
+                                                        self.sixtopStates[neighbor.id].txSeqNum)
                 else:
                     self._log(
                         DEBUG,
@@ -2751,67 +2889,12 @@ class Mote(object):
         # get cells to the neighbors
         scheduleList = []
 
-        # remove a cell based on ellsf's algorithm
-        # check below that you can only delete non-resf cells
-        # how can the minimal cell not be removed?
-
-        # if self.eLLSF is not None:
-        #
-        #     rxTimeslots = []
-        #     txTimeslots = []
-        #     if neighbor == self.preferredParent:
-        #         # by making sure ts is in ELLSF_TIMESLOTS, we make sure we only delete eLLSF cells, and we also avoid the minimal cell
-        #         rxTimeslots = [ts for (ts, cell) in self.schedule.iteritems() if
-        #                        cell['dir'] == DIR_TXRX_SHARED and cell[
-        #                            'neighbor'] != self.preferredParent and ts in self.eLLSF.ELLSF_TIMESLOTS and not
-        #                        cell['resf']]
-        #         txTimeslots = [ts for (ts, cell) in self.schedule.iteritems() if
-        #                        cell['dir'] == DIR_TXRX_SHARED and cell[
-        #                            'neighbor'] == self.preferredParent and ts in self.eLLSF.ELLSF_TIMESLOTS and not
-        #                        cell['resf']]
-        #     elif neighbor != self.preferredParent and not self._isBroadcast(neighbor):  # any other cell except a broadcast
-        #         # because now we only look at SHARED cells, tx and rx timeslots are the same, so basically we are removing the SHARED cell with the largest gap to its left
-        #         rxTimeslots = [ts for (ts, cell) in self.schedule.iteritems() if
-        #                        cell['dir'] == DIR_TXRX_SHARED and cell[
-        #                            'neighbor'] == neighbor and ts in self.eLLSF.ELLSF_TIMESLOTS and not cell['resf']]
-        #         txTimeslots = [ts for (ts, cell) in self.schedule.iteritems() if
-        #                        cell['dir'] == DIR_TXRX_SHARED and cell[
-        #                            'neighbor'] == neighbor and ts in self.eLLSF.ELLSF_TIMESLOTS and not cell['resf']]
-        #     elif self._isBroadcast(neighbor):  # broadcast cell
-        #         assert False;
-        #     else:  # don't know what to expect
-        #         assert False
-        #
-        #     txTsDistance = []
-        #     for i in range(len(txTimeslots)):
-        #         distance = 1000  # big value
-        #         for j in range(len(rxTimeslots)):
-        #             if txTimeslots[i] > rxTimeslots[j]:
-        #                 if txTimeslots[i] - rxTimeslots[j] < distance:
-        #                     distance = txTimeslots[i] - rxTimeslots[j]
-        #             else:
-        #                 if self.settings.slotframeLength + txTimeslots[i] - rxTimeslots[j] < distance:
-        #                     distance = self.settings.slotframeLength + txTimeslots[i] - rxTimeslots[j]
-        #         txTsDistance.append((txTimeslots[i], distance))
-        #
-        #     if len(rxTimeslots) > 0:
-        #         txTsDistance.sort(key=lambda x: x[1], reverse=True)
-        #     else:  # eg, when in a leaf node, there are no children, just delete a random one
-        #         self.genMSF.shuffle(txTsDistance)
-        #
-        #     for i in range(len(txTsDistance)):
-        #         numTxAck = self.schedule[txTsDistance[i][0]]['numTxAck']
-        #         numTx = self.schedule[txTsDistance[i][0]]['numTx']
-        #         cellPDR = self.getCellPDR(self.schedule[txTsDistance[i][0]])
-        #         scheduleList += [(txTsDistance[i][0], numTxAck, numTx, cellPDR)]
-        #
-        # else:
-            # worst cell removing initialized by theoretical pdr
+        # worst cell removing initialized by theoretical pdr
         for (ts, cell) in self.schedule.iteritems():
             # only remove the cell where ts == parentTs, the other ones will be removed automatically
-            if cell['parentTs'] == ts and ((cell['neighbor'] == neighbor and cell['dir'] == DIR_TX) or (cell['dir'] == DIR_TXRX_SHARED and cell['neighbor'] == neighbor)):
+            if cell.parentTs == ts and ((cell.neighbor == neighbor and cell.dir == DIR_TX) or (cell.dir == DIR_TXRX_SHARED and cell.neighbor == neighbor)):
                 cellPDR = self.getCellPDR(cell)
-                scheduleList += [(ts, cell['numTxAck'], cell['numTx'], cellPDR)]
+                scheduleList += [(ts, cell.numTxAck, cell.numTx, cellPDR)]
 
         if self.settings.sixtopRemoveRandomCell:
             # introduce randomness in the cell list order
@@ -2819,23 +2902,14 @@ class Mote(object):
         else:
             # triggered only when worst cell selection is due
             # (cell list is sorted according to worst cell selection)
-            scheduleListByPDR = {}
-            for tscell in scheduleList:
-                if not tscell[3] in scheduleListByPDR:
-                    scheduleListByPDR[tscell[3]] = []
-                scheduleListByPDR[tscell[3]] += [tscell]
             rssi = self.getRSSI(neighbor)
             modulation = None
             if self.settings.individualModulations == 1:
                 modulation = self.modulation[neighbor]
             # theoPDR = Topology.Topology.rssiToPdr(rssi, modulation=modulation)
             theoPDR = self.getPDR(neighbor)
-            scheduleList = []
-            for pdr in sorted(scheduleListByPDR.keys()):
-                if pdr < theoPDR:
-                    scheduleList += sorted(scheduleListByPDR[pdr], key=lambda x: x[2], reverse=True)
-                else:
-                    scheduleList += sorted(scheduleListByPDR[pdr], key=lambda x: x[2])
+            # by increasing pdr, cells below the theoretical pdr with most tx first, the others with least tx first
+            scheduleList.sort(key=lambda x: (x[3], -x[2] if x[3] < theoPDR else x[2]))
 
         # remove a given number of cells from the list of available cells (picks the first numCellToRemove)
         tsList = []
@@ -2864,10 +2938,10 @@ class Mote(object):
 
         # create new packet
         newPacket = {
-            'asn': self.engine.getAsn(),
+            'asn': self.engine.asn,
             'type': IANA_6TOP_TYPE_REQUEST,
             'code': IANA_6TOP_CMD_DELETE,
-            'payload': [cellList, numCells, dir, seq, self.engine.getAsn()],
+            'payload': [cellList, numCells, dir, seq, self.engine.asn],
             'retriesLeft': TSCH_MAXTXRETRIES,
             'srcIp': self,
             'dstIp': neighbor,  # currently upstream
@@ -2884,7 +2958,7 @@ class Mote(object):
 
         else:
             # set state to sending request for this neighbor
-            self.sixtopStates[neighbor.id]['tx']['state'] = SIX_STATE_SENDING_REQUEST
+            self.sixtopStates[neighbor.id].txState = SIX_STATE_SENDING_REQUEST
 
     def _sixtop_receive_DELETE_REQUEST(self, type, smac, payload):
         """ receive a 6P delete request message """
@@ -2899,10 +2973,10 @@ class Mote(object):
             # has the asn of when the req packet was enqueued in the neighbor. Used for calculate avg 6top latency
             self.tsSixTopReqRecv[neighbor] = payload[4]
 
-            if smac.id in self.sixtopStates and 'rx' in self.sixtopStates[smac.id] and self.sixtopStates[smac.id]['rx']['state'] != SIX_STATE_IDLE:
-                for pkt in self.txQueue:
+            if smac.id in self.sixtopStates and self.sixtopStates[smac.id].rxState not in (None, SIX_STATE_IDLE):
+                for pkt in list(self.txQueue):
                     if pkt['type'] == IANA_6TOP_TYPE_RESPONSE and pkt['dstIp'].id == smac.id:
-                        self.txQueue.remove(pkt)
+                        self._tsch_removeFromQueue(pkt)
                         self._log(
                             INFO,
                             "[6top] removed a 6TOP_TYPE_RESPONSE packet in the queue of mote {0} to neighbor {1}, because a new TYPE_REQUEST (delete) was received.",
@@ -2911,23 +2985,18 @@ class Mote(object):
                         # assert False
                 returnCode = IANA_6TOP_RC_RESET  # error, neighbor has to abort transaction
                 if smac.id not in self.sixtopStates:
-                    self.sixtopStates[smac.id] = {}
-                if 'rx' not in self.sixtopStates:
-                    self.sixtopStates[smac.id]['rx'] = {}
-                    self.sixtopStates[smac.id]['rx']['blockedCells'] = []
-                    self.sixtopStates[smac.id]['rx']['seqNum'] = 0
-                self.sixtopStates[smac.id]['rx']['state'] = SIX_STATE_REQUEST_DELETE_RECEIVED
+                    self.sixtopStates[smac.id] = SixtopState()
+                self.sixtopStates[smac.id].initRx()
+                self.sixtopStates[smac.id].rxState = SIX_STATE_REQUEST_DELETE_RECEIVED
                 self._sixtop_enqueue_RESPONSE(neighbor, [], returnCode, receivedDir, seq)
 
                 return
 
             # set state to receiving request for this neighbor
             if smac.id not in self.sixtopStates:
-                self.sixtopStates[smac.id] = {}
-            if 'rx' not in self.sixtopStates[neighbor.id]:
-                self.sixtopStates[smac.id]['rx'] = {}
-                self.sixtopStates[smac.id]['rx']['blockedCells'] = []
-                self.sixtopStates[smac.id]['rx']['seqNum'] = 0
+                self.sixtopStates[smac.id] = SixtopState()
+            if self.sixtopStates[smac.id].rxState is None:
+                self.sixtopStates[smac.id].initRx()
                 # if neighbor is not in sixtopstates and receives a delete, something has gone wrong. Send a RESET.
                 returnCode = IANA_6TOP_RC_RESET  # error, neighbor has to abort transaction
                 assert False
@@ -2935,7 +3004,7 @@ class Mote(object):
 
                 return
 
-            self.sixtopStates[smac.id]['rx']['state'] = SIX_STATE_REQUEST_DELETE_RECEIVED
+            self.sixtopStates[smac.id].rxState = SIX_STATE_REQUEST_DELETE_RECEIVED
 
             # set direction of cells
             if receivedDir == DIR_TX:
@@ -2948,7 +3017,7 @@ class Mote(object):
             returnCode = IANA_6TOP_RC_SUCCESS  # all is fine
 
             for cell in cellList:
-                if cell not in self.schedule.keys():
+                if cell not in self.schedule:
                     returnCode = IANA_6TOP_RC_NORES  # resources are not present
 
             # enqueue response
@@ -2967,6 +3036,12 @@ class Mote(object):
         self.backoffPerNeigh[neigh] = 0
         self.backoffExponentPerNeigh[neigh] = self.settings.backoffMinExp - 1
 
+    def _tsch_resetBackoffAllNeighbors(self):
+        """ resets the backoff towards every other mote, not only the current neighbors as these change with mobility """
+        otherMotes = [m for m in self.engine.motes if m is not self]
+        self.backoffPerNeigh.update(dict.fromkeys(otherMotes, 0))
+        self.backoffExponentPerNeigh.update(dict.fromkeys(otherMotes, self.settings.backoffMinExp - 1))
+
     def _tsch_enqueue(self, packet):
 
         if not self._rpl_addNextHop(packet):
@@ -2976,7 +3051,7 @@ class Mote(object):
             self._stats_incrementMoteStats('droppedNoRoute')
             return False
 
-        elif not (self.getTxCells() or self.getSharedCells()):
+        elif not (self.getNumTxCells() or self.getNumSharedCells()):
             # I don't have any transmit cells
 
             # increment mote state
@@ -2994,14 +3069,12 @@ class Mote(object):
             # This is because if the queues of the nodes are filled with DATA packets, new nodes won't be able to enter properly in the network. So there are exceptions.
 
             # if join is enabled, all nodes will wait until all nodes have at least 1 Tx cell. So it is allowed to enqueue 1 aditional DAO, JOIN or 6P packet
-            if packet['type'] == APP_TYPE_JOIN or packet['type'] == RPL_TYPE_DAO or packet[
-                'type'] == IANA_6TOP_TYPE_REQUEST or packet['type'] == IANA_6TOP_TYPE_RESPONSE:
-                for p in self.txQueue:
-                    if packet['type'] == p['type']:
-                        # There is already a DAO, JOIN or 6P in que queue, don't add more
-                        self._stats_incrementMoteStats('droppedQueueFull')
-                        return False
-                self.txQueue += [packet]
+            if packet['type'] in TSCH_QUEUE_PRIORITY_TYPES:
+                if self._txQueueTypeCount[packet['type']]:
+                    # There is already a DAO, JOIN or 6P in que queue, don't add more
+                    self._stats_incrementMoteStats('droppedQueueFull')
+                    return False
+                self._tsch_appendToQueue(packet)
                 return True
 
             # update mote stats
@@ -3013,13 +3086,39 @@ class Mote(object):
             # all is good
 
             # enqueue packet
-            self.txQueue += [packet]
+            self._tsch_appendToQueue(packet)
 
             return True
 
+    def _tsch_appendToQueue(self, packet):
+        self.txQueue.append(packet)
+        self._txQueueTypeCount[packet['type']] += 1
+
+    def _tsch_removeFromQueue(self, packet):
+        # the packet that was just sent is usually the head of the queue
+        if self.txQueue[0] is packet:
+            self.txQueue.popleft()
+        else:
+            self.txQueue.remove(packet)
+        self._txQueueTypeCount[packet['type']] -= 1
+
+    def _tsch_getAggregatedInfo(self, cell):
+        """
+        Reset and return the aggregated info of this mote for a TX/RX on the given (bonded) cell.
+        The propagation model only holds on to it until the end slot of the cell, after which the mote can not
+        start another TX/RX before the next cell, so one dict per mote is enough.
+        """
+        aggregatedInfo = self._aggregatedInfo
+        aggregatedInfo['startSlot'] = cell.parentTs
+        aggregatedInfo['endSlot'] = cell.parentTs + self._modulationSlots[cell.modulation] - 1
+        aggregatedInfo['modulation'] = cell.modulation
+        aggregatedInfo['success'] = True
+        del aggregatedInfo['interferers'][:]
+        return aggregatedInfo
+
     def _tsch_schedule_activeCell(self):
 
-        asn = self.engine.getAsn()
+        asn = self.engine.asn
         tsCurrent = asn % self.settings.slotframeLength
 
         # find closest active slot in schedule
@@ -3029,18 +3128,13 @@ class Mote(object):
                 self.engine.removeEvent(uniqueTag=(self.id, '_tsch_action_activeCell'))
                 return
 
+            slotframeLength = self.settings.slotframeLength
             tsDiffMin = None
-            for (ts, cell) in self.schedule.items():
-                if ts == tsCurrent:
-                    tsDiff = self.settings.slotframeLength
-                elif ts > tsCurrent:
-                    tsDiff = ts - tsCurrent
-                elif ts < tsCurrent:
-                    tsDiff = (ts + self.settings.slotframeLength) - tsCurrent
-                else:
-                    raise SystemError()
+            for ts in self.schedule:
+                # distance to the next occurrence of ts, a full slotframe if ts is the current slot
+                tsDiff = (ts - tsCurrent - 1) % slotframeLength + 1
 
-                if (not tsDiffMin) or (tsDiffMin > tsDiff):
+                if tsDiffMin is None or tsDiff < tsDiffMin:
                     tsDiffMin = tsDiff
 
         # schedule at that ASN
@@ -3057,348 +3151,235 @@ class Mote(object):
         interference and Rx packet drops.
         """
 
-        asn = self.engine.getAsn()
+        asn = self.engine.asn
         ts = asn % self.settings.slotframeLength
 
         with self.dataLock:
 
-            # make sure this is an active slot
-            assert ts in self.schedule
-
-            if self.settings.individualModulations == 0:
-                # make sure we're not in the middle of a TX/RX operation
-                assert not self.waitingFor
-
             cell = self.schedule[ts]
+            cellParentTs = cell.parentTs
 
-            # only if this does not belong to another cell, than you can use it
-            if cell['parentTs'] is None or (cell['parentTs'] is not None and cell['parentTs'] == ts):
+            # make sure we're not in the middle of a TX/RX operation (with individual modulations, only checked at the start of a bonded cell)
+            assert not self.waitingFor or (self.settings.individualModulations == 1 and cellParentTs is not None and cellParentTs != ts)
 
-                if self.settings.individualModulations == 1:
-                    # make sure we're not in the middle of a TX/RX operation
-                    assert not self.waitingFor
+            # only if this does not belong to another cell, than you can use it
+            if cellParentTs is None or cellParentTs == ts:
 
                 # Signal to MSF that a cell to a neighbor has been triggered
                 if self._msf_is_enabled():
-                    self._msf_signal_cell_elapsed(cell['neighbor'], cell['dir'])
-
-                if cell['dir'] == DIR_RX:
-
-                    aggregatedInfo = None
-                    if self.settings.individualModulations == 1 and cell['parentTs'] is not None:
-                        aggregatedInfo = {'startSlot': cell['parentTs'], \
-                                          'endSlot': (cell['parentTs'] + Modulation.Modulation().modulationSlots[self.settings.modulationConfig][
-                                              cell['modulation']] - 1), \
-                                          'modulation': cell['modulation'], \
-                                          'success': True, \
-                                          'packetSize': self.settings.packetSize, \
-                                          'interferers': []}
-
-                    # start listening
-                    self.propagation.startRx(
-                        mote=self,
-                        channel=cell['ch'],
-                        aggregatedInfo=aggregatedInfo
-                    )
-                    self.onGoingReception = True
+                    self._msf_signal_cell_elapsed(cell.neighbor, cell.dir)
 
-                    # indicate that we're waiting for the RX operation to finish
-                    self.waitingFor = DIR_RX
-
-                elif cell['dir'] == DIR_TX:
-                    # check whether packet to send
-                    self.pktToSend = None
-                    if self.txQueue:
-                        for pkt in self.txQueue:
-                            # send the frame if next hop matches the cell destination
-                            if pkt['nextHop'] == [cell['neighbor']]:
-                                self.pktToSend = pkt
-                                break
+                if cell.dir == DIR_RX:
+                    self._tsch_activeCell_rx(cell)
+                    self.onGoingReception = True
+                elif cell.dir == DIR_TX:
+                    self._tsch_activeCell_tx(cell)
+                elif cell.dir == DIR_TXRX_SHARED:
+                    self._tsch_activeCell_shared(cell, ts)
 
-                    # send packet
-                    if self.pktToSend:
+            # schedule next active cell
+            self._tsch_schedule_activeCell()
 
-                        # Signal to MSF that a cell to a neighbor is used
-                        if self._msf_is_enabled():
-                            self._msf_signal_cell_used(cell['neighbor'], cell['dir'], DIR_TX, pkt['type'])
+    def _tsch_activeCell_rx(self, cell):
+        """ start listening on a RX cell, or on a shared cell with nothing to send """
 
-                        cell['numTx'] += 1
+        aggregatedInfo = None
+        if self.settings.individualModulations == 1 and cell.parentTs is not None:
+            aggregatedInfo = self._tsch_getAggregatedInfo(cell)
 
-                        if pkt['type'] == IANA_6TOP_TYPE_REQUEST:
-                            if pkt['code'] == IANA_6TOP_CMD_ADD:
-                                self._stats_incrementMoteStats('6topTxAddReq')
+        # start listening
+        self.propagation.startRx(
+            mote=self,
+            channel=cell.ch,
+            aggregatedInfo=aggregatedInfo
+        )
 
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxAddReq += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxAddReq += 1
+        # indicate that we're waiting for the RX operation to finish
+        self.waitingFor = DIR_RX
 
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['tx'][
-                                    'state'] = SIX_STATE_WAIT_ADDREQUEST_SENDDONE
-                            elif pkt['code'] == IANA_6TOP_CMD_DELETE:
-                                self._stats_incrementMoteStats('6topTxDelReq')
+    def _tsch_activeCell_tx(self, cell):
+        """ send the first queued packet to the neighbor of a dedicated TX cell, if any """
 
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxDelReq += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxDelReq += 1
+        cellNeighbor = cell.neighbor
 
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['tx'][
-                                    'state'] = SIX_STATE_WAIT_DELETEREQUEST_SENDDONE
-                            else:
-                                assert False
+        # check whether packet to send
+        self.pktToSend = None
+        if self.txQueue:
+            for pkt in self.txQueue:
+                # send the frame if next hop matches the cell destination
+                if pkt['nextHop0'] is cellNeighbor:
+                    self.pktToSend = pkt
+                    break
 
-                        if pkt['type'] == RPL_TYPE_DAO:
-                            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                self.activeDAO += 1
-                            elif not self.settings.convergeFirst:
-                                self.activeDAO += 1
-
-                        if pkt['type'] == IANA_6TOP_TYPE_RESPONSE:
-                            if self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx'][
-                                'state'] == SIX_STATE_REQUEST_ADD_RECEIVED:
-                                self._stats_incrementMoteStats('6topTxAddResp')
-
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxAddResp += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxAddResp += 1
-
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx'][
-                                    'state'] = SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE
-                            elif self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx'][
-                                'state'] == SIX_STATE_REQUEST_DELETE_RECEIVED:
-                                self._stats_incrementMoteStats('6topTxDelResp')
-
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxDelResp += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxDelResp += 1
-
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx'][
-                                    'state'] = SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE
-                            elif self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx'][
-                                'state'] == SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE:
-                                pass
-                            elif self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx'][
-                                'state'] == SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE:
-                                pass
-                            else:
-                                assert False
+        # send packet
+        if self.pktToSend:
+            self._tsch_startTx(cell, [cellNeighbor])
 
-                        aggregatedInfo = None
-                        if self.settings.individualModulations == 1 and cell['parentTs'] is not None:
-                            aggregatedInfo = {'startSlot': cell['parentTs'], \
-                                                  'endSlot': (cell['parentTs'] + Modulation.Modulation().modulationSlots[self.settings.modulationConfig][cell['modulation']] - 1), \
-                                                  'modulation': cell['modulation'], \
-                                                  'success': True, \
-                                                  'packetSize': self.settings.packetSize, \
-                                                  'interferers': []}
-
-                        self.propagation.startTx(
-                            channel=cell['ch'],
-                            type=self.pktToSend['type'],
-                            code=self.pktToSend['code'],
-                            smac=self,
-                            dmac=[cell['neighbor']],
-                            srcIp=self.pktToSend['srcIp'],
-                            dstIp=self.pktToSend['dstIp'],
-                            srcRoute=self.pktToSend['sourceRoute'],
-                            payload=self.pktToSend['payload'],
-                            aggregatedInfo=aggregatedInfo
-                        )
+        # else:
+        #     if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+        #         if self.id not in self.engine.comehere:
+        #             self.engine.comehere[self.id] = 1
+        #         else:
+        #             self.engine.comehere[self.id] += 1
+        # else:
+        #     if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+        #         self.nrNoTxDataRxAck += [ts]
+        #     elif not self.settings.convergeFirst:
+        #         self.nrNoTxDataRxAck += [ts]
 
-                        # indicate that we're waiting for the TX operation to finish
-                        self.waitingFor = DIR_TX
+    def _tsch_activeCell_shared(self, cell, ts):
+        """ send on a shared cell if a packet is allowed to go out, listen otherwise """
 
-                    # else:
-                    #     if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                    #         if self.id not in self.engine.comehere:
-                    #             self.engine.comehere[self.id] = 1
-                    #         else:
-                    #             self.engine.comehere[self.id] += 1
-                    # else:
-                    #     if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                    #         self.nrNoTxDataRxAck += [ts]
-                    #     elif not self.settings.convergeFirst:
-                    #         self.nrNoTxDataRxAck += [ts]
+        cellNeighbor = cell.neighbor
 
-                elif cell['dir'] == DIR_TXRX_SHARED:
-                    # if cell['neighbor'] == self._myNeighbors():
-                    assert False
-                    if self._isBroadcast(cell['neighbor']):
-                        self.pktToSend = None
-                        if self.txQueue and self.backoffBroadcast == 0:
-                            for pkt in self.txQueue:
-                                # send join packets on the shared cell only on first hop
-                                if pkt['type'] == APP_TYPE_JOIN and len(
-                                        self.getTxCells(neighbor=pkt['nextHop'][0])) + len(
-                                        self.getSharedCells(neighbor=pkt['nextHop'][0])) == 0:
-                                    self.pktToSend = pkt
-                                    break
-                                # send 6P messages on the shared broadcast cell only if there is no dedicated cells to that neighbor
-                                elif pkt['type'] == IANA_6TOP_TYPE_REQUEST and len(
-                                        self.getTxCells(neighbor=pkt['nextHop'][0])) + len(
-                                        self.getSharedCells(neighbor=pkt['nextHop'][0])) == 0:
-                                    self.pktToSend = pkt
-                                    break
-                                # send 6P messages on the shared broadcast cell only if there is no dedicated cells to that neighbor
-                                elif pkt['type'] == IANA_6TOP_TYPE_RESPONSE and len(
-                                        self.getTxCells(neighbor=pkt['nextHop'][0])) + len(
-                                        self.getSharedCells(neighbor=pkt['nextHop'][0])) == 0:
-                                    self.pktToSend = pkt
-                                    break
-                                # DIOs and EBs always go on the shared broadcast cell
-                                elif pkt['type'] == RPL_TYPE_DIO or pkt['type'] == TSCH_TYPE_EB:
-                                    self.pktToSend = pkt
-                                    break
-                                else:
-                                    continue
-                        # Decrement backoff
-                        if self.backoffBroadcast > 0:
-                            self.backoffBroadcast -= 1
+        # if cell['neighbor'] == self._myNeighbors():
+        assert False
+        if self._isBroadcast(cellNeighbor):
+            self.pktToSend = None
+            if self.txQueue and self.backoffBroadcast == 0:
+                for pkt in self.txQueue:
+                    # send join packets on the shared cell only on first hop
+                    if pkt['type'] == APP_TYPE_JOIN and len(
+                            self.getTxCells(neighbor=pkt['nextHop'][0])) + len(
+                            self.getSharedCells(neighbor=pkt['nextHop'][0])) == 0:
+                        self.pktToSend = pkt
+                        break
+                    # send 6P messages on the shared broadcast cell only if there is no dedicated cells to that neighbor
+                    elif pkt['type'] == IANA_6TOP_TYPE_REQUEST and len(
+                            self.getTxCells(neighbor=pkt['nextHop'][0])) + len(
+                            self.getSharedCells(neighbor=pkt['nextHop'][0])) == 0:
+                        self.pktToSend = pkt
+                        break
+                    # send 6P messages on the shared broadcast cell only if there is no dedicated cells to that neighbor
+                    elif pkt['type'] == IANA_6TOP_TYPE_RESPONSE and len(
+                            self.getTxCells(neighbor=pkt['nextHop'][0])) + len(
+                            self.getSharedCells(neighbor=pkt['nextHop'][0])) == 0:
+                        self.pktToSend = pkt
+                        break
+                    # DIOs and EBs always go on the shared broadcast cell
+                    elif pkt['type'] == RPL_TYPE_DIO or pkt['type'] == TSCH_TYPE_EB:
+                        self.pktToSend = pkt
+                        break
                     else:
-                        if self.isSync:
-                            # check whether packet to send
-                            self.pktToSend = None
-                            if self.txQueue and self.backoffPerNeigh[cell['neighbor']] == 0:
-                                for pkt in self.txQueue:
-                                    # send the frame if next hop matches the cell destination
-                                    if pkt['nextHop'] == [cell['neighbor']] and pkt['dstIp'] != BROADCAST_ADDRESS:
-                                        self.pktToSend = pkt
-                                        break
-
-
-                        # if self.pktToSend is None and self.txQueue and self.backoffPerNeigh[cell['neighbor']] > 0:
-                        #     for pkt in self.txQueue:
-                        #         # send the frame if next hop matches the cell destination
-                        #         if pkt['nextHop'] == [cell['neighbor']]:
-                        #             self._msf_signal_cell_used(cell['neighbor'], cell['dir'], DIR_TX, pkt['type'])
-                        #             break
-
-                        # Decrement backoffPerNeigh
-                        if self.backoffPerNeigh[cell['neighbor']] > 0:
-                            self.backoffPerNeigh[cell['neighbor']] -= 1
-                            self._log(
-                                    INFO,
-                                    "[tsch] in ts {2} to neighbor {3}:  decrementing from {0} to {1}",
-                                (self.backoffPerNeigh[cell['neighbor']] + 1, self.backoffPerNeigh[cell['neighbor']], ts, cell['neighbor'].id)
-                                )
+                        continue
+            # Decrement backoff
+            if self.backoffBroadcast > 0:
+                self.backoffBroadcast -= 1
+        else:
+            if self.isSync:
+                # check whether packet to send
+                self.pktToSend = None
+                if self.txQueue and self.backoffPerNeigh[cellNeighbor] == 0:
+                    for pkt in self.txQueue:
+                        # send the frame if next hop matches the cell destination
+                        if pkt['nextHop0'] is cellNeighbor and pkt['dstIp'] != BROADCAST_ADDRESS:
+                            self.pktToSend = pkt
+                            break
 
-                    # send packet
-                    if self.pktToSend:
 
-                        cell['numTx'] += 1
+            # if self.pktToSend is None and self.txQueue and self.backoffPerNeigh[cell['neighbor']] > 0:
+            #     for pkt in self.txQueue:
+            #         # send the frame if next hop matches the cell destination
+            #         if pkt['nextHop'] == [cell['neighbor']]:
+            #             self._msf_signal_cell_used(cell['neighbor'], cell['dir'], DIR_TX, pkt['type'])
+            #             break
 
-                        # Signal to MSF that a cell to a neighbor is used
-                        if self._msf_is_enabled():
-                            self._msf_signal_cell_used(cell['neighbor'], cell['dir'], DIR_TX, pkt['type'])
+            # Decrement backoffPerNeigh
+            if self.backoffPerNeigh[cellNeighbor] > 0:
+                self.backoffPerNeigh[cellNeighbor] -= 1
+                self._log(
+                        INFO,
+                        "[tsch] in ts {2} to neighbor {3}:  decrementing from {0} to {1}",
+                    (self.backoffPerNeigh[cellNeighbor] + 1, self.backoffPerNeigh[cellNeighbor], ts, cellNeighbor.id)
+                    )
 
-                        if pkt['type'] == IANA_6TOP_TYPE_REQUEST:
-                            if pkt['code'] == IANA_6TOP_CMD_ADD:
-                                self._stats_incrementMoteStats('6topTxAddReq')
+        # send packet
+        if self.pktToSend:
+            self._tsch_startTx(cell, self.pktToSend['nextHop'])
+        else:
+            self._tsch_activeCell_rx(cell)
 
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxAddReq += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxAddReq += 1
+    def _tsch_startTx(self, cell, dmac):
+        """ hand self.pktToSend to the propagation model, updating the 6top states and counters """
 
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['tx'][
-                                    'state'] = SIX_STATE_WAIT_ADDREQUEST_SENDDONE
-                            elif pkt['code'] == IANA_6TOP_CMD_DELETE:
-                                self._stats_incrementMoteStats('6topTxDelReq')
+        pkt = self.pktToSend
+        pktType = pkt['type']
 
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxDelReq += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxDelReq += 1
+        cell.numTx += 1
+        if type(cell.neighbor) is not list:
+            self._txStatsPerNeigh[cell.neighbor][0] += 1
 
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['tx']['state'] = SIX_STATE_WAIT_DELETEREQUEST_SENDDONE
-                            else:
-                                assert False
+        # Signal to MSF that a cell to a neighbor is used
+        if self._msf_is_enabled():
+            self._msf_signal_cell_used(cell.neighbor, cell.dir, DIR_TX, pktType)
 
-                        if pkt['type'] == IANA_6TOP_TYPE_RESPONSE:
-                            if self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx']['state'] == SIX_STATE_REQUEST_ADD_RECEIVED:
-                                self._stats_incrementMoteStats('6topTxAddResp')
-
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxAddResp += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxAddResp += 1
-
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx']['state'] = SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE
-                            elif self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx']['state'] == SIX_STATE_REQUEST_DELETE_RECEIVED:
-                                self._stats_incrementMoteStats('6topTxDelResp')
-
-                                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                    self.sixtopTxDelResp += 1
-                                elif not self.settings.convergeFirst:
-                                    self.sixtopTxDelResp += 1
-
-                                self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx']['state'] = SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE
-                            elif self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx']['state'] == SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE:
-                                pass
-                            elif self.sixtopStates[self.pktToSend['nextHop'][0].id]['rx']['state'] == SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE:
-                                pass
-                            else:
-                                assert False
+        if pktType == IANA_6TOP_TYPE_REQUEST or pktType == IANA_6TOP_TYPE_RESPONSE:
+            sixtopState = self.sixtopStates[pkt['nextHop'][0].id]
 
-                        if pkt['type'] == RPL_TYPE_DAO:
-                            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                                self.activeDAO += 1
-                            elif not self.settings.convergeFirst:
-                                self.activeDAO += 1
-
-                        aggregatedInfo = None
-                        if self.settings.individualModulations == 1 and cell['parentTs'] is not None:
-                            aggregatedInfo = {'startSlot': cell['parentTs'], \
-                                                  'endSlot': (cell['parentTs'] + Modulation.Modulation().modulationSlots[self.settings.modulationConfig][cell['modulation']] - 1), \
-                                                  'modulation': cell['modulation'], \
-                                                  'success': True, \
-                                                  'packetSize': self.settings.packetSize, \
-                                                  'interferers': []}
-
-                        self.propagation.startTx(
-                            channel=cell['ch'],
-                            type=self.pktToSend['type'],
-                            code=self.pktToSend['code'],
-                            smac=self,
-                            dmac=self.pktToSend['nextHop'],
-                            srcIp=self.pktToSend['srcIp'],
-                            dstIp=self.pktToSend['dstIp'],
-                            srcRoute=self.pktToSend['sourceRoute'],
-                            payload=self.pktToSend['payload'],
-                            aggregatedInfo=aggregatedInfo
-                        )
-                        self.waitingFor = DIR_TX
+        if pktType == IANA_6TOP_TYPE_REQUEST:
+            if pkt['code'] == IANA_6TOP_CMD_ADD:
+                self._stats_incrementMoteStats('6topTxAddReq')
 
-                    else:
-                        aggregatedInfo = None
-                        if self.settings.individualModulations == 1 and cell['parentTs'] is not None:
-                            aggregatedInfo = {'startSlot': cell['parentTs'], \
-                                              'endSlot': (cell['parentTs'] + Modulation.Modulation().modulationSlots[self.settings.modulationConfig][cell['modulation']] - 1), \
-                                              'modulation': cell['modulation'], \
-                                              'success': True, \
-                                              'packetSize': self.settings.packetSize, \
-                                              'interferers': []}
-                        # start listening
-                        self.propagation.startRx(
-                            mote=self,
-                            channel=cell['ch'],
-                            aggregatedInfo=aggregatedInfo
-                        )
+                if self.engine.countStats:
+                    self.sixtopTxAddReq += 1
 
-                        # indicate that we're waiting for the RX operation to finish
-                        self.waitingFor = DIR_RX
+                sixtopState.txState = SIX_STATE_WAIT_ADDREQUEST_SENDDONE
+            elif pkt['code'] == IANA_6TOP_CMD_DELETE:
+                self._stats_incrementMoteStats('6topTxDelReq')
 
-            # schedule next active cell
-            self._tsch_schedule_activeCell()
+                if self.engine.countStats:
+                    self.sixtopTxDelReq += 1
+
+                sixtopState.txState = SIX_STATE_WAIT_DELETEREQUEST_SENDDONE
+            else:
+                assert False
+
+        if pktType == IANA_6TOP_TYPE_RESPONSE:
+            if sixtopState.rxState == SIX_STATE_REQUEST_ADD_RECEIVED:
+                self._stats_incrementMoteStats('6topTxAddResp')
+
+                if self.engine.countStats:
+                    self.sixtopTxAddResp += 1
+
+                sixtopState.rxState = SIX_STATE_WAIT_ADD_RESPONSE_SENDDONE
+            elif sixtopState.rxState == SIX_STATE_REQUEST_DELETE_RECEIVED:
+                self._stats_incrementMoteStats('6topTxDelResp')
+
+                if self.engine.countStats:
+                    self.sixtopTxDelResp += 1
+
+                sixtopState.rxState = SIX_STATE_WAIT_DELETE_RESPONSE_SENDDONE
+            elif sixtopState.rxState in SIX_STATES_WAIT_RESPONSE_SENDDONE:
+                pass
+            else:
+                assert False
+
+        if pktType == RPL_TYPE_DAO:
+            if self.engine.countStats:
+                self.activeDAO += 1
+
+        aggregatedInfo = None
+        if self.settings.individualModulations == 1 and cell.parentTs is not None:
+            aggregatedInfo = self._tsch_getAggregatedInfo(cell)
+
+        self.propagation.startTx(
+            channel=cell.ch,
+            type=pktType,
+            code=pkt['code'],
+            smac=self,
+            dmac=dmac,
+            srcIp=pkt['srcIp'],
+            dstIp=pkt['dstIp'],
+            srcRoute=pkt['sourceRoute'],
+            payload=pkt['payload'],
+            aggregatedInfo=aggregatedInfo
+        )
+
+        # indicate that we're waiting for the TX operation to finish
+        self.waitingFor = DIR_TX
 
     def getMote(self, id):
-        for m in self.engine.motes:
-            if m.id == id:
-                return m
-        assert False
+        return self.engine.moteById[id]
 
     def _ilp_tsch_addCells(self, sigmaList):
         print 'ILP adding for mote %s' % self
@@ -3412,13 +3393,12 @@ class Mote(object):
             if mcs not in Modulation.Modulation().allowedModulations[self.settings.modulationConfig]:
                 assert False
             # the number of slots given by the ILP for the mcs should match the number by our Modulation config
-            if slots != Modulation.Modulation().modulationSlots[self.settings.modulationConfig][mcs]:
+            if slots != self._modulationSlots[mcs]:
                 print slots
-                print Modulation.Modulation().modulationSlots[self.settings.modulationConfig][mcs]
+                print self._modulationSlots[mcs]
                 assert False
             parent_timeslot = None
             first = True
-            cell_list = []
             if first:
                 parent_timeslot = ts
                 first = False
@@ -3434,48 +3414,46 @@ class Mote(object):
             else:
                 assert False # it should be one of the above
 
-            for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][mcs]):
-                cell_list += [(ts + i, ch, cell_dir)]
+            cell_list = [(ts + i, ch, cell_dir) for i in range(self._modulationSlots[mcs])]
+            for (cell_ts, _, _) in cell_list:
                 self._log(
                     INFO,
                     '[ILP - 6top] add {4} cell ts={0},ch={1} from {2} to {3}',
-                    (ts + i, ch, self.id, neighbor.id, cell_dir),
+                    (cell_ts, ch, self.id, neighbor.id, cell_dir),
                 )
             # add this the cell
-            self._tsch_addCells(neighbor, cell_list, parentTs=parent_timeslot, modulation=mcs)
+            self._tsch_addCells(neighbor, cell_list, parentTs=parent_timeslot, modulation=mcs, scheduleActiveCell=False)
+        if sigmaList:
+            self._tsch_schedule_activeCell()
 
-    def _tsch_addCells(self, neighbor, cellList, parentTs=None, modulation=None):
-        """ adds cell(s) to the schedule """
+    def _tsch_addCells(self, neighbor, cellList, parentTs=None, modulation=None, scheduleActiveCell=True):
+        """ adds cell(s) to the schedule, callers adding several batches can reschedule the active cell once themselves """
 
         with self.dataLock:
             for cell in cellList:
-                assert cell[0] not in self.schedule.keys()
-                self.schedule[cell[0]] = {
-                    'ch': cell[1],
-                    'dir': cell[2],
-                    'neighbor': neighbor,
-                    'numTx': 0,
-                    'numTxAck': 0,
-                    'numRx': 0,
-                    'history': [],
-                    'sharedCellSuccess': 0,  # indicator of success for shared cells
-                    'sharedCellCollision': 0,  # indicator of a collision for shared cells
-                    'rxDetectedCollision': False,
-                    'debug_canbeInterfered': [],
-                # [debug] shows schedule collision that can be interfered with minRssi or larger level
-                    'debug_interference': [],  # [debug] shows an interference packet with minRssi or larger level
-                    'debug_lockInterference': [],  # [debug] shows locking on the interference packet
-                    'debug_cellCreatedAsn': self.engine.getAsn(),  # [debug]
-                    'parentTs': parentTs,
-                    'modulation': modulation
-                }
+                assert cell[0] not in self.schedule
+                newCell = Cell(
+                    ch=cell[1],
+                    dir=cell[2],
+                    neighbor=neighbor,
+                    createdAsn=self.engine.asn,
+                    parentTs=parentTs,
+                    modulation=modulation,
+                )
+                self.schedule[cell[0]] = newCell
+                self._cellsByDir[cell[2]][cell[0]] = newCell
+                if type(neighbor) is Mote:
+                    self._numDedicatedCells += 1
+                if cell[2] == DIR_TX:
+                    self.engine.txCellOccupancy.setdefault((cell[0], cell[1]), []).append(self)
                 # log
                 # self._log(
                 #     INFO,
                 #     "[tsch] add cell ts={0} ch={1} dir={2} with {3} (and backupDuration {4})",
                 #     (cell[0], cell[1], cell[2], neighbor.id if not type(neighbor) == list else BROADCAST_ADDRESS, str(backupDuration))),
                 # )
-            self._tsch_schedule_activeCell()
+            if scheduleActiveCell:
+                self._tsch_schedule_activeCell()
 
     def _tsch_removeCells(self, neighbor, tsList):
         """ removes cell(s) from the schedule """
@@ -3490,10 +3468,19 @@ class Mote(object):
                     (cell, neighbor.id if not type(neighbor) == list else BROADCAST_ADDRESS),
                 )
 
-                assert cell in self.schedule.keys()
-                assert self.schedule[cell]['neighbor'] == neighbor
+                assert cell in self.schedule
+                assert self.schedule[cell].neighbor == neighbor
 
-                self.schedule.pop(cell)
+                removedCell = self.schedule.pop(cell)
+                del self._cellsByDir[removedCell.dir][cell]
+                if type(removedCell.neighbor) is Mote:
+                    self._numDedicatedCells -= 1
+                if removedCell.dir == DIR_TX:
+                    self.engine.txCellOccupancy[(cell, removedCell.ch)].remove(self)
+                if (removedCell.numTx or removedCell.numTxAck) and type(removedCell.neighbor) is not list:
+                    txStats = self._txStatsPerNeigh[removedCell.neighbor]
+                    txStats[0] -= removedCell.numTx
+                    txStats[1] -= removedCell.numTxAck
 
                 # if cell <= self.engine.asn % self.settings.slotframeLength:
                 #     # you should not count this cell for the sleep slots
@@ -3510,7 +3497,9 @@ class Mote(object):
 
         with self.dataLock:
             for c in range(0, self.settings.nrMinimalCells):
-                self.schedule[c]['neighbor'] = self._myNeighbors()
+                # minimal cells are always shared with the broadcast list, so no per-neighbor counts to move
+                assert type(self.schedule[c].neighbor) is list
+                self.schedule[c].neighbor = self._myNeighbors()
                 # log
                 # self._log(
                 #     INFO,
@@ -3536,7 +3525,7 @@ class Mote(object):
             self._tsch_schedule_synchronize()
 
     def _tsch_schedule_synchronize(self):
-        asn = self.engine.getAsn()
+        asn = self.engine.asn
 
         self.engine.scheduleAtAsn(
             asn=asn + 1,
@@ -3552,15 +3541,17 @@ class Mote(object):
         # self._tsch_addCells(self._myNeighbors(), [(40, 8, DIR_TXRX_SHARED)])
         # self._tsch_addCells(self._myNeighbors(), [(80, 15, DIR_TXRX_SHARED)])
         # if self.settings.ilpfile is None:
-        for c in range(0, self.settings.nrMinimalCells):
-            modulation = None
-            if self.settings.individualModulations == 1:
-                modulation = Modulation.Modulation().minimalCellModulation[self.settings.modulationConfig]
-                parentTs = c * (Modulation.Modulation().modulationSlots[self.settings.modulationConfig][modulation])
-                for i in range(Modulation.Modulation().modulationSlots[self.settings.modulationConfig][modulation]):
-                    self._tsch_addCells(self._myNeighbors(), [(parentTs+i, c, DIR_TXRX_SHARED)], parentTs=parentTs, modulation=modulation)
-            else:
-                self._tsch_addCells(self._myNeighbors(), [(c, c, DIR_TXRX_SHARED)], parentTs=c, modulation=modulation)
+        neighbors = self._myNeighbors()
+        if self.settings.individualModulations == 1:
+            modulation = self._minimalCellModulation
+            numSlots = self._modulationSlots[modulation]
+            for c in range(0, self.settings.nrMinimalCells):
+                parentTs = c * numSlots
+                self._tsch_addCells(neighbors, [(parentTs + i, c, DIR_TXRX_SHARED) for i in range(numSlots)], parentTs=parentTs, modulation=modulation, scheduleActiveCell=False)
+        else:
+            for c in range(0, self.settings.nrMinimalCells):
+                self._tsch_addCells(neighbors, [(c, c, DIR_TXRX_SHARED)], parentTs=c, modulation=None, scheduleActiveCell=False)
+        self._tsch_schedule_activeCell()
         # else:
         #     # assert False
         #     pass
@@ -3574,8 +3565,7 @@ class Mote(object):
 
     def _radio_drop_packet(self, pkt, reason):
         # remove all the element of pkt so that it won't be processed further
-        for k in pkt.keys():
-            del pkt[k]
+        pkt.clear()
         if reason in self.motestats:
             self._stats_incrementMoteStats(reason)
 
@@ -3586,180 +3576,175 @@ class Mote(object):
     def radio_txDone(self, isACKed, isNACKed):
         """end of tx slot"""
 
-        asn = self.engine.getAsn()
+        asn = self.engine.asn
         ts = asn % self.settings.slotframeLength
+        # bound once, several branches below log
+        _log = self._log
 
         with self.dataLock:
 
-            assert ts in self.schedule
-            assert self.schedule[ts]['dir'] == DIR_TX or self.schedule[ts]['dir'] == DIR_TXRX_SHARED
+            cell = self.schedule[ts]
+            assert cell.dir == DIR_TX or cell.dir == DIR_TXRX_SHARED
             assert self.waitingFor == DIR_TX
 
+            # whether this slot counts for the statistics, and the modulation it was sent with
+            countStats = self.engine.countStats
+            modulation = cell.modulation
+            neighbor = cell.neighbor
+
+            pkt = self.pktToSend
+            pktType = pkt['type']
+            dstId = pkt['dstIp'].id if pkt['dstIp'] != BROADCAST_ADDRESS else None
+
             # for debug
-            ch = self.schedule[ts]['ch']
-            rx = self.schedule[ts]['neighbor']
-            canbeInterfered = 0
-            for mote in self.engine.motes:
-                if mote == self:
-                    continue
-                if ts in mote.schedule and ch == mote.schedule[ts]['ch'] and mote.schedule[ts]['dir'] == DIR_TX:
-                    if mote.id == rx.id or mote.getRSSI(rx) > rx.minRssi:
+            if DEBUG_SCHEDULE:
+                ch = cell.ch
+                rx = neighbor
+                canbeInterfered = 0
+                for mote in self.engine.txCellOccupancy.get((ts, ch), []):
+                    if mote == self:
+                        continue
+                    if mote.id == rx.id or mote.RSSI[rx.id] > rx.minRssi:
                         canbeInterfered = 1
-            self.schedule[ts]['debug_canbeInterfered'] += [canbeInterfered]
+                        break
+                cell.debug_canbeInterfered.append(canbeInterfered)
 
             if isACKed:
                 # ACK received
                 self._logChargeConsumed(CHARGE_TxDataRxAck_uC)
-                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+                if countStats:
                     self.nrTxDataRxAck += 1
-                    self.consumption['nrTxDataRxAck'][self.schedule[ts]['modulation']] += 1
-                elif not self.settings.convergeFirst:
-                    self.nrTxDataRxAck += 1
-                    self.consumption['nrTxDataRxAck'][self.schedule[ts]['modulation']] += 1
+                    self.consumption['nrTxDataRxAck'][modulation] += 1
 
                 # update schedule stats
-                self.schedule[ts]['numTxAck'] += 1
+                cell.numTxAck += 1
+                if type(neighbor) is not list:
+                    self._txStatsPerNeigh[neighbor][1] += 1
 
                 # update history
-                self.schedule[ts]['history'] += [1]
+                cell.history.append(1)
 
                 # update queue stats
-                self._stats_logQueueDelay(asn - self.pktToSend['asn'])
+                self._stats_logQueueDelay(asn - pkt['asn'])
 
                 # time correction
-                if self.schedule[ts]['neighbor'] == self.preferredParent:
+                if neighbor == self.preferredParent:
                     self.timeCorrectedSlot = asn
 
                 # received an ACK for the request, change state and increase the sequence number
-                if self.pktToSend['type'] == IANA_6TOP_TYPE_REQUEST:
-                    if self.pktToSend['code'] == IANA_6TOP_CMD_ADD:
+                if pktType == IANA_6TOP_TYPE_REQUEST:
+                    sixtopState = self.sixtopStates[dstId]
+                    if pkt['code'] == IANA_6TOP_CMD_ADD:
 
-                        assert self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['state'] == SIX_STATE_WAIT_ADDREQUEST_SENDDONE
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['state'] = SIX_STATE_WAIT_ADDRESPONSE
+                        assert sixtopState.txState == SIX_STATE_WAIT_ADDREQUEST_SENDDONE
+                        sixtopState.txState = SIX_STATE_WAIT_ADDRESPONSE
 
                         # calculate the asn at which it should fire
-                        fireASN = int(self.engine.getAsn() + (
-                                float(self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timeout']) / float(
-                            self.settings.slotDuration)))
-                        uniqueTag = '_sixtop_timer_fired_dest_%s' % self.pktToSend['dstIp'].id
+                        fireASN = int(asn + sixtopState.txTimeout * self._invSlotDuration)
+                        uniqueTag = '_sixtop_timer_fired_dest_%s' % dstId
                         self.engine.scheduleAtAsn(
                             asn=fireASN,
                             cb=self._sixtop_timer_fired,
                             uniqueTag=(self.id, uniqueTag),
                             priority=5,
                         )
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timer'] = {}
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timer']['tag'] = (self.id, uniqueTag)
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timer']['asn'] = fireASN
-                        self._log(
+                        sixtopState.txTimerTag = (self.id, uniqueTag)
+                        sixtopState.txTimerAsn = fireASN
+                        _log(
                             DEBUG,
                             "[6top] activated a timer for mote {0} to neighbor {1} on asn {2} with tag {3} ( timeout {4} )",
-                            (self.id, self.pktToSend['dstIp'].id, fireASN, str((self.id, uniqueTag)), float(self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timeout'])),
+                            (self.id, dstId, fireASN, str((self.id, uniqueTag)), float(sixtopState.txTimeout)),
                         )
-                    elif self.pktToSend['code'] == IANA_6TOP_CMD_DELETE:
-                        assert self.sixtopStates[self.pktToSend['dstIp'].id]['tx'][
-                                   'state'] == SIX_STATE_WAIT_DELETEREQUEST_SENDDONE
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['state'] = SIX_STATE_WAIT_DELETERESPONSE
+                    elif pkt['code'] == IANA_6TOP_CMD_DELETE:
+                        assert sixtopState.txState == SIX_STATE_WAIT_DELETEREQUEST_SENDDONE
+                        sixtopState.txState = SIX_STATE_WAIT_DELETERESPONSE
 
                         # calculate the asn at which it should fire
-                        fireASN = int(self.engine.getAsn() + (
-                                    float(self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timeout']) / float(
-                                self.settings.slotDuration)))
-                        uniqueTag = '_sixtop_timer_fired_dest_%s' % self.pktToSend['dstIp'].id
+                        fireASN = int(asn + sixtopState.txTimeout * self._invSlotDuration)
+                        uniqueTag = '_sixtop_timer_fired_dest_%s' % dstId
                         self.engine.scheduleAtAsn(
                             asn=fireASN,
                             cb=self._sixtop_timer_fired,
                             uniqueTag=(self.id, uniqueTag),
                             priority=5,
                         )
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timer'] = {}
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timer']['tag'] = (self.id, uniqueTag)
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['timer']['asn'] = fireASN
-                        self._log(
+                        sixtopState.txTimerTag = (self.id, uniqueTag)
+                        sixtopState.txTimerAsn = fireASN
+                        _log(
                             DEBUG,
                             "[6top] activated a timer for mote {0} to neighbor {1} on asn {2} with tag {3}",
-                            (self.id, self.pktToSend['dstIp'].id, fireASN, str((self.id, uniqueTag))),
+                            (self.id, dstId, fireASN, str((self.id, uniqueTag))),
                         )
                     else:
                         assert False
 
-                # save it in a tmp variable
-                # because it is possible that self.schedule[ts] does not exist anymore after receiving an ACK for a DELETE RESPONSE
-                tmpNeighbor = self.schedule[ts]['neighbor']
-                tmpDir = self.schedule[ts]['dir']
+                # self.schedule[ts] might not exist anymore after receiving an ACK for a DELETE RESPONSE,
+                # so the rest of this branch only uses the locally bound cell
+                cellDir = cell.dir
 
-                if self.pktToSend['type'] == IANA_6TOP_TYPE_RESPONSE:  # received an ACK for the response, handle the schedule
-                    self._sixtop_receive_RESPONSE_ACK(self.pktToSend)
+                if pktType == IANA_6TOP_TYPE_RESPONSE:  # received an ACK for the response, handle the schedule
+                    self._sixtop_receive_RESPONSE_ACK(pkt)
 
-                if self.pktToSend[ 'type'] == APP_TYPE_DATA:  #
-                    self._log(
+                if pktType == APP_TYPE_DATA:  #
+                    _log(
                         DEBUG,
                         "[tsch] Successfully sent DATA packet",
                     )
 
                 # remove packet from queue
-                self.txQueue.remove(self.pktToSend)
+                self._tsch_removeFromQueue(pkt)
                 # reset backoff in case of shared slot or in case of a tx slot when the queue is empty
-                if tmpDir == DIR_TXRX_SHARED or (tmpDir == DIR_TX and not self.txQueue):
-                    if tmpDir == DIR_TXRX_SHARED and not self._isBroadcast(tmpNeighbor):
-                        self._tsch_resetBackoffPerNeigh(tmpNeighbor)
+                if cellDir == DIR_TXRX_SHARED or (cellDir == DIR_TX and not self.txQueue):
+                    if cellDir == DIR_TXRX_SHARED and not self._isBroadcast(neighbor):
+                        self._tsch_resetBackoffPerNeigh(neighbor)
                     else:
                         self._tsch_resetBroadcastBackoff()
 
             elif isNACKed:
                 # NACK received
                 self._logChargeConsumed(CHARGE_TxDataRxAck_uC)
-                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                    self.nrTxDataRxAck += 1
-                    self.consumption['nrTxDataRxAck'][self.schedule[ts]['modulation']] += 1
-                elif not self.settings.convergeFirst:
+                if countStats:
                     self.nrTxDataRxAck += 1
-                    self.consumption['nrTxDataRxAck'][self.schedule[ts]['modulation']] += 1
-
-                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                    self.nrTxDataRxNack += 1
-                    self.consumption['nrTxDataRxNack'][self.schedule[ts]['modulation']] += 1
-                elif not self.settings.convergeFirst:
+                    self.consumption['nrTxDataRxAck'][modulation] += 1
                     self.nrTxDataRxNack += 1
-                    self.consumption['nrTxDataRxNack'][self.schedule[ts]['modulation']] += 1
+                    self.consumption['nrTxDataRxNack'][modulation] += 1
 
                 # update schedule stats as if it were successfully transmitted
-                self.schedule[ts]['numTxAck'] += 1
+                cell.numTxAck += 1
+                if type(neighbor) is not list:
+                    self._txStatsPerNeigh[neighbor][1] += 1
 
                 # update history
-                self.schedule[ts]['history'] += [1]
+                cell.history.append(1)
 
                 # time correction
-                if self.schedule[ts]['neighbor'] == self.preferredParent:
+                if neighbor == self.preferredParent:
                     self.timeCorrectedSlot = asn
 
-                if self.pktToSend['type'] == APP_TYPE_DATA:  #
-                    self._log(
+                if pktType == APP_TYPE_DATA:  #
+                    _log(
                         DEBUG,
                         "[tsch] at ts {0}, UNsuccessfully sent DATA packet (NACK) --> back off {1}",
-                        (ts,self.backoffPerNeigh[self.schedule[ts]['neighbor']])
+                        (ts,self.backoffPerNeigh[neighbor])
                     )
-                if self.pktToSend['type'] == IANA_6TOP_TYPE_RESPONSE:  #
-                    self._log(
+                if pktType == IANA_6TOP_TYPE_RESPONSE:  #
+                    _log(
                         DEBUG,
                         "[tsch] at ts {0}, UNsuccessfully sent RESPONSE packet (NACK) --> back off {1}",
-                        (ts,self.backoffPerNeigh[self.schedule[ts]['neighbor']])
+                        (ts,self.backoffPerNeigh[neighbor])
                     )
 
                 # decrement 'retriesLeft' counter associated with that packet
-                i = self.txQueue.index(self.pktToSend)
-                if self.txQueue[i]['retriesLeft'] > 0:
-                    self.txQueue[i]['retriesLeft'] -= 1
+                if pkt['retriesLeft'] > 0:
+                    pkt['retriesLeft'] -= 1
 
                 # drop packet if retried too many time
-                if self.txQueue[i]['retriesLeft'] == 0:
+                if pkt['retriesLeft'] == 0:
                     # if len(self.txQueue) == TSCH_QUEUE_SIZE:
 
                     # only count drops of DATA packets that are part of the experiment
-                    if self.pktToSend['type'] == APP_TYPE_DATA:
-                        if self.settings.convergeFirst and self.pktToSend['payload'][1] >= self.engine.asnInitExperiment and self.pktToSend['payload'][1] <= self.engine.asnEndExperiment:
-                            self.pktDropMac += 1
-                        elif not self.settings.convergeFirst:
+                    if pktType == APP_TYPE_DATA:
+                        if not self.settings.convergeFirst or self.engine.asnInitExperiment <= pkt['payload'][1] <= self.engine.asnEndExperiment:
                             self.pktDropMac += 1
                         self._stats_incrementMoteStats('droppedDataMacRetries')
 
@@ -3767,24 +3752,26 @@ class Mote(object):
                     self._stats_incrementMoteStats('droppedMacRetries')
 
                     # remove packet from queue
-                    self.txQueue.remove(self.pktToSend)
+                    self._tsch_removeFromQueue(pkt)
 
                     # reset state for this neighbor
                     # go back to IDLE, i.e. remove the neighbor form the states
                     # but, in the case of a response msg, if the node received another, already new request, from the same node (because its timer fired), do not go to IDLE
-                    if self.pktToSend['type'] == IANA_6TOP_TYPE_REQUEST:
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['state'] = SIX_STATE_IDLE
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['blockedCells'] = []
-                    elif self.pktToSend['type'] == IANA_6TOP_TYPE_RESPONSE:
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['rx']['state'] = SIX_STATE_IDLE
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['rx']['blockedCells'] = []
+                    if pktType == IANA_6TOP_TYPE_REQUEST:
+                        sixtopState = self.sixtopStates[dstId]
+                        sixtopState.txState = SIX_STATE_IDLE
+                        sixtopState.txBlockedCells = []
+                    elif pktType == IANA_6TOP_TYPE_RESPONSE:
+                        sixtopState = self.sixtopStates[dstId]
+                        sixtopState.rxState = SIX_STATE_IDLE
+                        sixtopState.rxBlockedCells = []
                     # else:
                     #     if self.pktToSend['type'] != APP_TYPE_DATA:
                     #         # update mote stats
                     #         self._stats_incrementMoteStats('droppedMacRetries')
                     # 
                     #         # remove packet from queue
-                    #         self.txQueue.remove(self.pktToSend)
+                    #         self._tsch_removeFromQueue(self.pktToSend)
                     # 
                     #         if self.pktToSend['type'] == IANA_6TOP_TYPE_REQUEST:
                     #             self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['state'] = SIX_STATE_IDLE
@@ -3794,78 +3781,68 @@ class Mote(object):
                     #             self.sixtopStates[self.pktToSend['dstIp'].id]['rx']['blockedCells'] = []
 
                 # reset backoff in case of shared slot or in case of a tx slot when the queue is empty
-                if self.schedule[ts]['dir'] == DIR_TXRX_SHARED or (self.schedule[ts]['dir'] == DIR_TX and not self.txQueue):
-                    if self.schedule[ts]['dir'] == DIR_TXRX_SHARED and not self._isBroadcast(self.schedule[ts]['neighbor']):
-                        self._tsch_resetBackoffPerNeigh(self.schedule[ts]['neighbor'])
+                if cell.dir == DIR_TXRX_SHARED or (cell.dir == DIR_TX and not self.txQueue):
+                    if cell.dir == DIR_TXRX_SHARED and not self._isBroadcast(neighbor):
+                        self._tsch_resetBackoffPerNeigh(neighbor)
                     else:
                         self._tsch_resetBroadcastBackoff()
-            elif self.pktToSend['dstIp'] == BROADCAST_ADDRESS:
+            elif pkt['dstIp'] == BROADCAST_ADDRESS:
                 # broadcast packet is not acked, remove from queue and update stats
                 self._logChargeConsumed(CHARGE_TxData_uC)
-                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                    self.nrTxData += 1
-                    self.consumption['nrTxData'][self.schedule[ts]['modulation']] += 1
-                elif not self.settings.convergeFirst:
+                if countStats:
                     self.nrTxData += 1
-                    self.consumption['nrTxData'][self.schedule[ts]['modulation']] += 1
-                self.txQueue.remove(self.pktToSend)
+                    self.consumption['nrTxData'][modulation] += 1
+                self._tsch_removeFromQueue(pkt)
                 self._tsch_resetBroadcastBackoff()
 
             else:
                 # neither ACK nor NACK received
                 self._logChargeConsumed(CHARGE_TxDataRxAck_uC)
-                if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                    self.nrTxDataNoAck += 1
-                    self.consumption['nrTxDataNoAck'][self.schedule[ts]['modulation']] += 1
-                elif not self.settings.convergeFirst:
+                if countStats:
                     self.nrTxDataNoAck += 1
-                    self.consumption['nrTxDataNoAck'][self.schedule[ts]['modulation']] += 1
+                    self.consumption['nrTxDataNoAck'][modulation] += 1
 
                 # increment backoffExponent and get new backoff value
-                if self.schedule[ts]['dir'] == DIR_TXRX_SHARED:
-                    if self._isBroadcast(self.schedule[ts]['neighbor']):
+                if cell.dir == DIR_TXRX_SHARED:
+                    if self._isBroadcast(neighbor):
                         # if self.backoffBroadcastExponent < self.settings.backoffMaxExp:
                         #     self.backoffBroadcastExponent += 1
                         if self.backoffBroadcastExponent < 4:
                             self.backoffBroadcastExponent += 1
-                        self.backoffBroadcast = self.genEBDIO.randint(0, 2 ** self.backoffBroadcastExponent - 1)
+                        self.backoffBroadcast = self.genEBDIO.randint(0, (1 << self.backoffBroadcastExponent) - 1)
                     else:
-                        if self.backoffExponentPerNeigh[self.schedule[ts]['neighbor']] < self.settings.backoffMaxExp:
-                            self.backoffExponentPerNeigh[self.schedule[ts]['neighbor']] += 1
-                        self.backoffPerNeigh[self.schedule[ts]['neighbor']] = self.genEBDIO.randint(0, 2 **
-                                                                                             self.backoffExponentPerNeigh[
-                                                                                                 self.schedule[ts][
-                                                                                                     'neighbor']] - 1)
-                if self.pktToSend['type'] == APP_TYPE_DATA:  #
-                    self._log(
+                        backoffExponent = self.backoffExponentPerNeigh[neighbor]
+                        if backoffExponent < self.settings.backoffMaxExp:
+                            backoffExponent += 1
+                            self.backoffExponentPerNeigh[neighbor] = backoffExponent
+                        self.backoffPerNeigh[neighbor] = self.genEBDIO.randint(0, (1 << backoffExponent) - 1)
+                if pktType == APP_TYPE_DATA:  #
+                    _log(
                         DEBUG,
                         "[tsch] at ts {0}, UNsuccessfully sent DATA packet (NO RESPONSE), back off",
                         (ts,)
                     )
-                if self.pktToSend['type'] == IANA_6TOP_TYPE_RESPONSE:  #
-                    self._log(
+                if pktType == IANA_6TOP_TYPE_RESPONSE:  #
+                    _log(
                         DEBUG,
                         "[tsch] at ts {0}, UNsuccessfully sent RESPONSE packet (NO RESPONSE), back off",
                         (ts,)
                     )
 
                 # update history
-                self.schedule[ts]['history'] += [0]
+                cell.history.append(0)
 
                 # decrement 'retriesLeft' counter associated with that packet
-                i = self.txQueue.index(self.pktToSend)
-                if self.txQueue[i]['retriesLeft'] > 0:
-                    self.txQueue[i]['retriesLeft'] -= 1
+                if pkt['retriesLeft'] > 0:
+                    pkt['retriesLeft'] -= 1
 
                 # drop packet if retried too many time
-                if self.txQueue[i]['retriesLeft'] == 0:
+                if pkt['retriesLeft'] == 0:
                     # if len(self.txQueue) == TSCH_QUEUE_SIZE:
 
                     # counts drops of DATA packets
-                    if self.pktToSend['type'] == APP_TYPE_DATA:
-                        if self.settings.convergeFirst and self.pktToSend['payload'][1] >= self.engine.asnInitExperiment and self.pktToSend['payload'][1] <= self.engine.asnEndExperiment:
-                            self.pktDropMac += 1
-                        elif not self.settings.convergeFirst:
+                    if pktType == APP_TYPE_DATA:
+                        if not self.settings.convergeFirst or self.engine.asnInitExperiment <= pkt['payload'][1] <= self.engine.asnEndExperiment:
                             self.pktDropMac += 1
                         self._stats_incrementMoteStats('droppedDataMacRetries')
 
@@ -3873,16 +3850,18 @@ class Mote(object):
                     self._stats_incrementMoteStats('droppedMacRetries')
 
                     # remove packet from queue
-                    self.txQueue.remove(self.pktToSend)
+                    self._tsch_removeFromQueue(pkt)
 
                     # reset state for this neighbor
                     # go back to IDLE, i.e. remove the neighbor form the states
-                    if self.pktToSend['type'] == IANA_6TOP_TYPE_REQUEST:
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['state'] = SIX_STATE_IDLE
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['blockedCells'] = []
-                    elif self.pktToSend['type'] == IANA_6TOP_TYPE_RESPONSE:
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['rx']['state'] = SIX_STATE_IDLE
-                        self.sixtopStates[self.pktToSend['dstIp'].id]['rx']['blockedCells'] = []
+                    if pktType == IANA_6TOP_TYPE_REQUEST:
+                        sixtopState = self.sixtopStates[dstId]
+                        sixtopState.txState = SIX_STATE_IDLE
+                        sixtopState.txBlockedCells = []
+                    elif pktType == IANA_6TOP_TYPE_RESPONSE:
+                        sixtopState = self.sixtopStates[dstId]
+                        sixtopState.rxState = SIX_STATE_IDLE
+                        sixtopState.rxBlockedCells = []
                     # else:
                     #     if self.pktToSend['type'] != APP_TYPE_DATA:
                     #
@@ -3890,7 +3869,7 @@ class Mote(object):
                     #         self._stats_incrementMoteStats('droppedMacRetries')
                     #
                     #         # remove packet from queue
-                    #         self.txQueue.remove(self.pktToSend)
+                    #         self._tsch_removeFromQueue(self.pktToSend)
                     #
                     #         if self.pktToSend['type'] == IANA_6TOP_TYPE_REQUEST:
                     #             self.sixtopStates[self.pktToSend['dstIp'].id]['tx']['state'] = SIX_STATE_IDLE
@@ -3906,54 +3885,52 @@ class Mote(object):
                      payload=None):
         """end of RX radio activity"""
 
-        asn = self.engine.getAsn()
+        asn = self.engine.asn
         ts = asn % self.settings.slotframeLength
 
         with self.dataLock:
+            # not synchronized motes might be listening outside of their schedule
+            cell = self.schedule.get(ts)
+            modulation = cell.modulation if cell is not None else None
             if self.isSync:
-                assert ts in self.schedule
-                assert self.schedule[ts]['dir'] == DIR_RX or self.schedule[ts]['dir'] == DIR_TXRX_SHARED
+                assert cell is not None
+                assert cell.dir == DIR_RX or cell.dir == DIR_TXRX_SHARED
                 assert self.waitingFor == DIR_RX
 
             if smac and self in dmac:  # layer 2 addressing
                 # I received a packet
 
                 if self._msf_is_enabled() and self.isSync:
-                    self._msf_signal_cell_used(self.schedule[ts]['neighbor'], self.schedule[ts]['dir'], DIR_RX, type)
+                    self._msf_signal_cell_used(cell.neighbor, cell.dir, DIR_RX, type)
 
                 if dstIp != BROADCAST_ADDRESS:  # unicast packet
                     self._logChargeConsumed(CHARGE_RxDataTxAck_uC)
-                    if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                        self.nrRxDataTxAck += 1
-                        self.consumption['nrRxDataTxAck'][self.schedule[ts]['modulation']] += 1
-                    elif not self.settings.convergeFirst:
+                    if self.engine.countStats:
                         self.nrRxDataTxAck += 1
-                        self.consumption['nrRxDataTxAck'][self.schedule[ts]['modulation']] += 1
+                        self.consumption['nrRxDataTxAck'][modulation] += 1
                 else:  # broadcast
                     self._logChargeConsumed(CHARGE_RxData_uC)
-                    if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                        self.nrRxData += 1
-                        self.consumption['nrRxData'][self.schedule[ts]['modulation']] += 1
-                    elif not self.settings.convergeFirst:
-                        self.consumption['nrRxData'][self.schedule[ts]['modulation']] += 1
+                    if self.engine.countStats:
                         self.nrRxData += 1
+                        self.consumption['nrRxData'][modulation] += 1
 
                 if self.isSync:
                     # update schedule stats
-                    self.schedule[ts]['numRx'] += 1
+                    cell.numRx += 1
 
                 if type == APP_TYPE_FRAG:
-                    frag = {'type': type,
-                            'code': code,
-                            'retriesLeft': TSCH_MAXTXRETRIES,
-                            'smac': smac,
-                            'srcIp': srcIp,
-                            'dstIp': dstIp}
-                    frag['payload'] = copy.deepcopy(payload)
-                    frag['sourceRoute'] = copy.deepcopy(srcRoute)
                     self.waitingFor = None
-                    if (hasattr(self.settings, 'enableFragmentForwarding') and
-                            self.settings.enableFragmentForwarding):
+                    if self.forwardFragments:
+                        # only a fragment that may be forwarded needs its own copy
+                        frag = {'type': type,
+                                'code': code,
+                                'retriesLeft': TSCH_MAXTXRETRIES,
+                                'smac': smac,
+                                'srcIp': srcIp,
+                                'dstIp': dstIp}
+                        # the fragment header dict is rewritten when forwarding, the other payload fields are primitives
+                        frag['payload'] = [dict(p) if isinstance(p, dict) else p for p in payload]
+                        frag['sourceRoute'] = list(srcRoute) if srcRoute is not None else None
                         if self._app_is_frag_to_forward(frag) is True:
                             if self._tsch_enqueue(frag):
                                 # ACK when succeeded to enqueue
@@ -4002,28 +3979,30 @@ class Mote(object):
 
                         return isACKed, isNACKed
                 elif dstIp == self:
-                    # receiving packet
-                    if type == RPL_TYPE_DAO:
-                        self._rpl_action_receiveDAO(type, smac, payload)
+                    # receiving packet, most frequent types first
+                    if type == APP_TYPE_DATA:  # application packet
+                        timestampASN = asn
+                        if self.settings.individualModulations == 1:
+                            timestampASN = (asn - ts) + cell.parentTs
+                        # print 'ASN of receive = {0}, TS = {1}'.format(timestampASN, timestampASN % self.settings.slotframeLength)
+                        self._app_action_receivePacket(srcIp=srcIp, payload=payload, timestamp=timestampASN)
                         (isACKed, isNACKed) = (True, False)
-                    elif type == IANA_6TOP_TYPE_REQUEST and code == IANA_6TOP_CMD_ADD:  # received an 6P ADD request
-                        self._sixtop_receive_ADD_REQUEST(type, smac, payload)
+                    elif type == RPL_TYPE_DAO:
+                        self._rpl_action_receiveDAO(type, smac, payload)
                         (isACKed, isNACKed) = (True, False)
-                    elif type == IANA_6TOP_TYPE_REQUEST and code == IANA_6TOP_CMD_DELETE:  # received an 6P DELETE request
-                        self._sixtop_receive_DELETE_REQUEST(type, smac, payload)
+                    elif type == IANA_6TOP_TYPE_REQUEST:
+                        if code == IANA_6TOP_CMD_ADD:  # received an 6P ADD request
+                            self._sixtop_receive_ADD_REQUEST(type, smac, payload)
+                        elif code == IANA_6TOP_CMD_DELETE:  # received an 6P DELETE request
+                            self._sixtop_receive_DELETE_REQUEST(type, smac, payload)
+                        else:
+                            assert False
                         (isACKed, isNACKed) = (True, False)
                     elif type == IANA_6TOP_TYPE_RESPONSE:  # received an 6P response
                         if self._sixtop_receive_RESPONSE(type, code, smac, payload):
                             (isACKed, isNACKed) = (True, False)
                         else:
                             (isACKed, isNACKed) = (False, False)
-                    elif type == APP_TYPE_DATA:  # application packet
-                        timestampASN = asn
-                        if self.settings.individualModulations == 1:
-                            timestampASN = (asn - (asn % self.settings.slotframeLength)) + self.schedule[asn % self.settings.slotframeLength]['parentTs']
-                        # print 'ASN of receive = {0}, TS = {1}'.format(timestampASN, timestampASN % self.settings.slotframeLength)
-                        self._app_action_receivePacket(srcIp=srcIp, payload=payload, timestamp=timestampASN)
-                        (isACKed, isNACKed) = (True, False)
                     elif type == APP_TYPE_ACK:
                         self._app_action_receiveAck(srcIp=srcIp, payload=payload, timestamp=asn)
                         (isACKed, isNACKed) = (True, False)
@@ -4043,11 +4022,11 @@ class Mote(object):
 
                     if type == APP_TYPE_DATA:
                         # update the number of hops
-                        newPayload = copy.deepcopy(payload)
+                        newPayload = list(payload)
                         newPayload[2] += 1
                     else:
                         # copy the payload and forward
-                        newPayload = copy.deepcopy(payload)
+                        newPayload = list(payload)
 
                     # create packet
                     relayPacket = {
@@ -4062,8 +4041,7 @@ class Mote(object):
                     }
 
                     # enqueue packet in TSCH queue
-                    if (type == APP_TYPE_DATA and hasattr(self.settings, 'numFragments') and
-                            self.settings.numFragments > 1):
+                    if type == APP_TYPE_DATA and self.fragmentPackets:
                         self._app_frag_packet(relayPacket)
                         # we return ack since we've received the last fragment successfully
                         (isACKed, isNACKed) = (True, False)
@@ -4086,20 +4064,14 @@ class Mote(object):
                 # log charge usage
                 if self.isSync:
                     self._logChargeConsumed(CHARGE_Idle_uC)
-                    if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+                    if self.engine.countStats:
                         self.nrIdle += 1
-                        self.consumption['nrIdle'][self.schedule[ts]['modulation']] += 1
-                    elif not self.settings.convergeFirst:
-                        self.nrIdle += 1
-                        self.consumption['nrIdle'][self.schedule[ts]['modulation']] += 1
+                        self.consumption['nrIdle'][modulation] += 1
                 else:
                     self._logChargeConsumed(CHARGE_IdleNotSync_uC)
-                    if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
-                        self.nrIdleNotSync += 1
-                        self.consumption['nrIdleNotSync'][self.schedule[ts]['modulation']] += 1
-                    elif not self.settings.convergeFirst:
+                    if self.engine.countStats:
                         self.nrIdleNotSync += 1
-                        self.consumption['nrIdleNotSync'][self.schedule[ts]['modulation']] += 1
+                        self.consumption['nrIdleNotSync'][modulation] += 1
 
                 (isACKed, isNACKed) = (False, False)
 
@@ -4112,18 +4084,25 @@ class Mote(object):
     def getCellPDR(self, cell):
         """ returns the pdr of the cell """
 
-        assert cell['neighbor'] is not type(list)
-
         with self.dataLock:
-            if cell['numTx'] < NUM_SUFFICIENT_TX:
-                return self.getPDR(cell['neighbor'])
+            if cell.numTx < NUM_SUFFICIENT_TX:
+                return self.getPDR(cell.neighbor)
             else:
-                return float(cell['numTxAck']) / float(cell['numTx'])
+                return float(cell.numTxAck) / float(cell.numTx)
 
     def setPDR(self, neighbor, pdr):
         """ sets the pdr to that neighbor"""
         with self.dataLock:
             self.PDR[neighbor] = pdr
+            self._myNeighborsCache = None
+            self._myNeighborsSet = None
+
+    def clearPDR(self):
+        """ clears the pdr to all neighbors"""
+        with self.dataLock:
+            self.PDR = {}
+            self._myNeighborsCache = None
+            self._myNeighborsSet = None
 
     def getPDR(self, neighbor):
         """ returns the pdr to that neighbor"""
@@ -4150,6 +4129,7 @@ class Mote(object):
         """ sets the RSSI to that neighbor"""
         with self.dataLock:
             self.RSSI[neighbor.id] = rssi
+            self.RSSImW[neighbor.id] = math.pow(10.0, rssi / 10.0)
 
     def getRSSI(self, neighbor):
         """ returns the RSSI to that neighbor"""
@@ -4164,11 +4144,10 @@ class Mote(object):
             numTx = NUM_SUFFICIENT_TX
             numTxAck = math.floor(pdr * numTx)
 
-            for (_, cell) in self.schedule.items():
-                if (cell['neighbor'] == neighbor and cell['dir'] == DIR_TX) or (
-                        cell['neighbor'] == neighbor and cell['dir'] == DIR_TXRX_SHARED):
-                    numTx += cell['numTx']
-                    numTxAck += cell['numTxAck']
+            # only TX and shared cells are ever used to transmit, so they hold all the counts
+            if neighbor in self._txStatsPerNeigh:
+                numTx += self._txStatsPerNeigh[neighbor][0]
+                numTxAck += self._txStatsPerNeigh[neighbor][1]
 
             # abort if about to divide by 0
             if not numTxAck:
@@ -4180,7 +4159,20 @@ class Mote(object):
             return etx
 
     def _myNeighbors(self):
-        return [n for n in self.PDR.keys() if self.PDR[n] > 0]
+        # callers keep the list (e.g. as neighbor of a shared cell), so hand out a copy
+        return list(self._myNeighborsShared())
+
+    def _myNeighborsShared(self):
+        """ the cached neighbors, only for callers that iterate over them right away """
+        if self._myNeighborsCache is None:
+            self._myNeighborsCache = [n for n in self.PDR.keys() if self.PDR[n] > 0]
+            self._myNeighborsSet = set(self._myNeighborsCache)
+        return self._myNeighborsCache
+
+    def _isMyNeighbor(self, mote):
+        if self._myNeighborsSet is None:
+            self._myNeighborsShared()
+        return mote in self._myNeighborsSet
 
     def _isBroadcast(self, neighbor):
         if type(neighbor) is list:
@@ -4195,7 +4187,7 @@ class Mote(object):
         if self.dagRoot:
             return 0.0
 
-        asn = self.engine.getAsn()
+        asn = self.engine.asn
         offset = 0.0
         child = self
         parent = self.preferredParent
@@ -4229,76 +4221,70 @@ class Mote(object):
     def _calculateRepulsionVector(self, targetX, targetY, towardsCentroid=False):
         ''' Calculate the resulting repulsion vector'''
 
-        repulsionVectorPolar = []
+        # running sum of the cartesian repulsion components, and how many there are
+        sumRepulsionX = 0
+        sumRepulsionY = 0
+        numRepulsions = 0
 
         startDegrees = 0
         endDegrees = 60
         scanDistance = 0.5
+        scanDistanceSquared = scanDistance * scanDistance
+
+        # scan step: 1000 / 50.0
+        div = 20.0
+        x = self.x
+        y = self.y
+        checkValidPosition = self.engine.checkValidPosition
 
         # angle for the attraction
-        rads = math.atan2((targetX - self.y), (targetY - self.x))
+        rads = math.atan2((targetX - y), (targetY - x))
         angle = rads - (3.14159 / 2.0) + (0.017453278 * startDegrees)  # degrees
         for i in xrange(startDegrees, endDegrees, 5):  # the repulsion is checked with an array of size 12  that represent 60 degrees of search
             # from 60 degrees to 120, center at 90
             angle = angle + 0.08725  # +5 degree in rads
-            # xdelta = math.cos(angle) / div
-            # ydelta = math.sin(angle) / div
-            xdelta = math.cos(angle) / float(1000 / 50.0)
-            ydelta = math.sin(angle) / float(1000 / 50.0)
-            objectx = self.x
-            objecty = self.y
-            distance = 0.0
+            cosAngle = math.cos(angle)
+            sinAngle = math.sin(angle)
+            xdelta = cosAngle / div
+            ydelta = sinAngle / div
+            objectx = x
+            objecty = y
             # search obstacles at every angle
             obstacleFound = False
             while not obstacleFound:
-                # update distance
-                distance = math.sqrt(
-                    (objectx - self.x) ** 2 +
-                    (objecty - self.y) ** 2
-                )
+                # update (squared) distance
+                dx = objectx - x
+                dy = objecty - y
+                distanceSquared = dx * dx + dy * dy
                 # if not obstacle, check a bit further in the same angle
-                if self.engine.checkValidPosition(objectx, objecty, countSquare=False) and (distance) < scanDistance:
+                if checkValidPosition(objectx, objecty, countSquare=False) and distanceSquared < scanDistanceSquared:
                     objectx = objectx + xdelta
                     objecty = objecty + ydelta
                 else:
                     obstacleFound = True  # there is an obstacle at this angle and distance
-                    if distance >= (scanDistance):
-                        distance = scanDistance  # max is 400m
-                    else:
-                    #     # obstacles found before 400m, insert point
-                        repulsionVectorPolar.append([angle, distance])
-
-        # all repulsion component have been calculated
-        self.repulsionVectorCart = []
-
-        i = 0
-        for (alfa, mod) in repulsionVectorPolar:
-            if mod < scanDistance:  # I only save the vectors that have any obstacle
-                if mod < 0.1:  # nearest objects have a surplus of repulsion
-                    self.repulsionVectorCart.append([8 * (math.cos(alfa) * (scanDistance - mod)), 8 * (math.sin(alfa) * (scanDistance - mod))])
-                elif mod < 0.2:  # nearest objects have a surplus of repulsion
-                    self.repulsionVectorCart.append([5 * (math.cos(alfa) * (scanDistance - mod)), 5 * (math.sin(alfa) * (scanDistance - mod))])
-                else:
-                    self.repulsionVectorCart.append([(math.cos(alfa) * (scanDistance - mod)), (math.sin(alfa) * (scanDistance - mod))])
-            i += 1
-
-        sumRepulsionX = 0
-        sumRepulsionY = 0
+                    if distanceSquared < scanDistanceSquared:
+                        # obstacles found before 400m, add its repulsion
+                        mod = math.sqrt(distanceSquared)
+                        if mod < scanDistance:
+                            if mod < 0.1:  # nearest objects have a surplus of repulsion
+                                sumRepulsionX += 8 * (cosAngle * (scanDistance - mod))
+                                sumRepulsionY += 8 * (sinAngle * (scanDistance - mod))
+                            elif mod < 0.2:  # nearest objects have a surplus of repulsion
+                                sumRepulsionX += 5 * (cosAngle * (scanDistance - mod))
+                                sumRepulsionY += 5 * (sinAngle * (scanDistance - mod))
+                            else:
+                                sumRepulsionX += cosAngle * (scanDistance - mod)
+                                sumRepulsionY += sinAngle * (scanDistance - mod)
+                            numRepulsions += 1
 
-        # convert to cartesian to sum the components
-        for (xval, yval) in self.repulsionVectorCart:
-            sumRepulsionX = sumRepulsionX + xval
-            sumRepulsionY = sumRepulsionY + yval
-        sumRepulsionX = sumRepulsionX / float(len(self.repulsionVectorCart) + 1)  # (len(self.repulsionVectorCart)+1)
-        sumRepulsionY = sumRepulsionY / float(len(self.repulsionVectorCart) + 1)  # (len(self.repulsionVectorCart)+1)
+        # all repulsion component have been summed
+        sumRepulsionX = sumRepulsionX / float(numRepulsions + 1)
+        sumRepulsionY = sumRepulsionY / float(numRepulsions + 1)
 
         # print 'repulsive calculation: %.20f, %.20f' % (sumRepulsionX, sumRepulsionY)
 
-        # return the values in polar
-        sumRepMod = math.sqrt(sumRepulsionX ** 2 + sumRepulsionY ** 2)
-        sumRepAlfa = math.atan2(sumRepulsionY, sumRepulsionX)
-
-        return (sumRepMod, sumRepAlfa)
+        # return the values in cartesian, the caller sums them with the attraction
+        return (sumRepulsionX, sumRepulsionY)
 
 
     def updateLocation(self):
@@ -4311,15 +4297,15 @@ class Mote(object):
 
             prevX = self.x
             prevY = self.y
+            squareSide = self.settings.squareSide
             correctlyMoved = False
             while not correctlyMoved:
 
                 rads = 2 * 3.14159 * self.genMobility.random()
-                xdelta = math.cos(rads) / float(div)
-                ydelta = math.sin(rads) / float(div)
-                if (self.x + xdelta) < self.settings.squareSide and (self.y + ydelta) < self.settings.squareSide:
-                    if self.x + xdelta > 0 and self.y + ydelta > 0:
-                        correctlyMoved = True
+                xdelta = math.cos(rads) / div
+                ydelta = math.sin(rads) / div
+                if 0 < prevX + xdelta < squareSide and 0 < prevY + ydelta < squareSide:
+                    correctlyMoved = True
 
             self.setLocation(self.x + xdelta, self.y + ydelta)
 
@@ -4333,7 +4319,7 @@ class Mote(object):
             targetX = self.engine.targetPos[self.id][0]
             targetY = self.engine.targetPos[self.id][1]
 
-            (repMod, repAlpha) = self._calculateRepulsionVector(targetX, targetY)
+            (repX, repY) = self._calculateRepulsionVector(targetX, targetY)
 
             repulsiveForce = 1
             attractiveForce = 1
@@ -4342,38 +4328,54 @@ class Mote(object):
             speed = float(self.genMobility.gauss(self.settings.mobilitySpeed, 1)) # on average 1.5m per cycle
             div = 1000 / float(speed)
 
-            # calculate dest angle
-            rads = math.atan2((targetY - self.y), (targetX - self.x))
-            # print 'rads: %.20f' % (rads)
-
-            xdelta = math.cos(rads) * attractiveForce # attraction vector
-            ydelta = math.sin(rads) * attractiveForce # attraction vector
+            # unit vector towards the target, (1, 0) on the target itself as atan2(0, 0) is 0
+            targetDx = targetX - self.x
+            targetDy = targetY - self.y
+            targetDistance = math.hypot(targetDx, targetDy)
+            if targetDistance > 0:
+                xdelta = targetDx / targetDistance * attractiveForce # attraction vector
+                ydelta = targetDy / targetDistance * attractiveForce # attraction vector
+            else:
+                xdelta = float(attractiveForce)
+                ydelta = 0.0
             # print 'attractive: %.20f, %.20f' % (xdelta, ydelta)
 
             self.attVec = (xdelta, ydelta)
 
-            repX = -1.0 * math.cos(repAlpha) * repMod * repulsiveForce # reverse the repulsive vector
-            repY = -1.0 * math.sin(repAlpha) * repMod * repulsiveForce # reverse the repulsive vector
+            repX = -1.0 * repX * repulsiveForce # reverse the repulsive vector
+            repY = -1.0 * repY * repulsiveForce # reverse the repulsive vector
             # print 'repulsive: %.20f, %.20f' % (repX, repY)
 
             self.repVec = (repX, repY)
 
-            # resulting angle
-            alfatot = math.atan2((ydelta + repY), (xdelta + repX))
+            # resulting direction, as a unit vector
+            resX = xdelta + repX
+            resY = ydelta + repY
+            resMod = math.hypot(resX, resY)
+            if resMod > 0:
+                resX /= resMod
+                resY /= resMod
+            else:
+                (resX, resY) = (1.0, 0.0)
 
             # introduce some randomness for the random comp
             randAngle = self.genMobility.randint(0, 45) * 3.14159 / 180  # random choose between 0 or 45 degrees
-            r = self.genMobility.randint(-1, 1)
+            # random sign, drawn as randint(-1, 1) draws it so a seed keeps its trajectories
+            random01 = self.genMobility.random
+            r = 0
             while r == 0:
-                r = self.genMobility.randint(-1, 1)
+                r = int(random01() * 3) - 1
             randAngle *= r
 
-            alfatot += randAngle
+            # rotate the resulting direction by the random angle
+            cosRand = math.cos(randAngle)
+            sinRand = math.sin(randAngle)
+            (resX, resY) = (resX * cosRand - resY * sinRand, resX * sinRand + resY * cosRand)
 
-            xdelta_mov = math.cos(alfatot) / float(div) # x, vector result with speed
-            ydelta_mov = math.sin(alfatot) / float(div) # y, vector result with speed
+            xdelta_mov = resX / float(div) # x, vector result with speed
+            ydelta_mov = resY / float(div) # y, vector result with speed
 
-            self.resVec = (math.cos(alfatot), math.sin(alfatot))
+            self.resVec = (resX, resY)
 
             # while not correctlyMoved:	#inside the simulation square or outside the objects
             if self.engine.checkValidPosition(self.x + xdelta_mov, self.y + ydelta_mov, True):
@@ -4467,14 +4469,16 @@ class Mote(object):
             self.isJoined = True  # we consider all nodes have joined
             self._tsch_add_minimal_cell()
             self._init_stack()
-        for n in self._myNeighbors():
-            self._log(
-                INFO,
-                'Modulation from mote {0} to mote {1} = {2} (RSSI = {4}, PDR = {3}, distance = {5} m)',
-                (self.id, n.id, self.getModulation(n), self.getPDR(n), self.getRSSI(n), self.engine.topology._computeDistance(self, n)),
-            )
-        if not self.dagRoot:
-            print 'My (mote %d) preferred parent is %d' % (self.id, self.preferredParent.id)
+        if log.isEnabledFor(logging.INFO):
+            # only gather the per-neighbor link details when they get logged
+            for n in self._myNeighborsShared():
+                self._log(
+                    INFO,
+                    'Modulation from mote {0} to mote {1} = {2} (RSSI = {4}, PDR = {3}, distance = {5} m)',
+                    (self.id, n.id, self.getModulation(n), self.getPDR(n), self.getRSSI(n), self.engine.topology._computeDistance(self, n)),
+                )
+            if not self.dagRoot:
+                self._log(INFO, 'My (mote {0}) preferred parent is {1}', (self.id, self.preferredParent.id))
 
     def _init_stack(self):
         # start the stack layer by layer
@@ -4494,9 +4498,7 @@ class Mote(object):
         if not self.settings.withJoin or self.dagRoot:
             # for m in self._myNeighbors():
             #     self._tsch_resetBackoffPerNeigh(m)
-            for m in self.engine.motes:
-                if m.id != self.id:
-                    self._tsch_resetBackoffPerNeigh(m)
+            self._tsch_resetBackoffAllNeighbors()
 
         # MSF
         if self._msf_is_enabled():
@@ -4511,7 +4513,7 @@ class Mote(object):
 
     def _logChargeConsumed(self, charge):
         with self.dataLock:
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment:
+            if self.engine.inExperiment:
                 self.chargeConsumed += charge
 
     def set_distance(self, mote, distance):
@@ -4526,26 +4528,31 @@ class Mote(object):
 
     # ===== getters
 
-    def getTxCells(self, neighbor=None):
+    def _getCells(self, dir, neighbor):
         with self.dataLock:
+            cells = self._cellsByDir[dir]
             if neighbor is None:
-                return [(ts, c['ch'], c['neighbor']) for (ts, c) in self.schedule.items() if c['dir'] == DIR_TX]
+                return [(ts, c.ch, c.neighbor) for (ts, c) in cells.iteritems()]
             else:
-                return [(ts, c['ch'], c['neighbor']) for (ts, c) in self.schedule.items() if c['dir'] == DIR_TX and c['neighbor'] == neighbor]
+                return [(ts, c.ch, c.neighbor) for (ts, c) in cells.iteritems() if c.neighbor == neighbor]
+
+    def getTxCells(self, neighbor=None):
+        return self._getCells(DIR_TX, neighbor)
 
     def getRxCells(self, neighbor=None):
-        with self.dataLock:
-            if neighbor is None:
-                return [(ts, c['ch'], c['neighbor']) for (ts, c) in self.schedule.items() if c['dir'] == DIR_RX]
-            else:
-                return [(ts, c['ch'], c['neighbor']) for (ts, c) in self.schedule.items() if c['dir'] == DIR_RX and c['neighbor'] == neighbor]
+        return self._getCells(DIR_RX, neighbor)
 
     def getSharedCells(self, neighbor=None):
-        with self.dataLock:
-            if neighbor is None:
-                return [(ts, c['ch'], c['neighbor']) for (ts, c) in self.schedule.items() if c['dir'] == DIR_TXRX_SHARED]
-            else:
-                return [(ts, c['ch'], c['neighbor']) for (ts, c) in self.schedule.items() if c['dir'] == DIR_TXRX_SHARED and c['neighbor'] == neighbor]
+        return self._getCells(DIR_TXRX_SHARED, neighbor)
+
+    def getNumTxCells(self):
+        return len(self._cellsByDir[DIR_TX])
+
+    def getNumRxCells(self):
+        return len(self._cellsByDir[DIR_RX])
+
+    def getNumSharedCells(self):
+        return len(self._cellsByDir[DIR_TXRX_SHARED])
 
     # ===== stats
 
@@ -4553,27 +4560,36 @@ class Mote(object):
 
     def getMoteStats(self):
 
-        # gather statistics
+        # gather statistics, the _stats_getAve*/_stats_reset* helpers rely on this lock being held
         with self.dataLock:
-            dataPktQueues = 0
-            for p in self.txQueue:
-                if not self.settings.convergeFirst and p['type'] == APP_TYPE_DATA:
-                    dataPktQueues += 1
-                elif self.settings.convergeFirst and p['type'] == APP_TYPE_DATA and p['payload'][1] >= self.engine.asnInitExperiment and p['payload'][1] <= self.engine.asnEndExperiment:
-                    dataPktQueues += 1
-
-            returnVal = copy.deepcopy(self.motestats)
-            returnVal['numTxCells'] = len(self.getTxCells())
-            returnVal['numRxCells'] = len(self.getRxCells())
-            returnVal['numDedicatedCells'] = len([(ts, c) for (ts, c) in self.schedule.items() if type(self) == type(c['neighbor'])])
-            returnVal['numSharedCells'] = len(self.getSharedCells())
+            if not self.settings.convergeFirst:
+                dataPktQueues = self._txQueueTypeCount[APP_TYPE_DATA]
+            else:
+                dataPktQueues = 0
+                if self._txQueueTypeCount[APP_TYPE_DATA]:
+                    asnInitExperiment = self.engine.asnInitExperiment
+                    asnEndExperiment = self.engine.asnEndExperiment
+                    for p in self.txQueue:
+                        if p['type'] == APP_TYPE_DATA and asnInitExperiment <= p['payload'][1] <= asnEndExperiment:
+                            dataPktQueues += 1
+
+            numTx = 0
+            for cell in self.schedule.itervalues():
+                numTx += cell.numTx
+
+            # handed out as is, _stats_resetMoteStats below starts a fresh dict
+            returnVal = self.motestats
+            returnVal['numTxCells'] = self.getNumTxCells()
+            returnVal['numRxCells'] = self.getNumRxCells()
+            returnVal['numDedicatedCells'] = self._numDedicatedCells
+            returnVal['numSharedCells'] = self.getNumSharedCells()
             returnVal['aveQueueDelay'] = self._stats_getAveQueueDelay()
             returnVal['aveLatency'] = self._stats_getAveLatency()
             returnVal['aveHops'] = self._stats_getAveHops()
             returnVal['probableCollisions'] = self._stats_getRadioStats('probableCollisions')
             returnVal['txQueueFill'] = len(self.txQueue)
             returnVal['chargeConsumed'] = self.chargeConsumed
-            returnVal['numTx'] = sum([cell['numTx'] for (_, cell) in self.schedule.items()])
+            returnVal['numTx'] = numTx
             returnVal['pktReceived'] = self.pktReceived
             returnVal['pktGen'] = self.pktGen
             returnVal['pktDropQueue'] = self.pktDropQueue
@@ -4583,56 +4599,18 @@ class Mote(object):
             returnVal['dataQueueFill'] = dataPktQueues
             returnVal['aveSixtopLatency'] = self._stats_getAveSixTopLatency()
 
-        # reset the statistics
-        self._stats_resetMoteStats()
-        self._stats_resetQueueStats()
-        self._stats_resetLatencyStats()
-        self._stats_resetHopsStats()
-        self._stats_resetRadioStats()
-        self._stats_resetSixTopLatencyStats()
+            # reset the statistics
+            self._stats_resetMoteStats()
+            self._stats_resetQueueStats()
+            self._stats_resetLatencyStats()
+            self._stats_resetHopsStats()
+            self._stats_resetRadioStats()
+            self._stats_resetSixTopLatencyStats()
 
         return returnVal
 
     def _stats_resetMoteStats(self):
-        with self.dataLock:
-            self.motestats = {
-                # app
-                'appGenerated': 0,  # number of packets app layer generated
-                'appRelayed': 0,  # number of packets relayed
-                'appReachesDagroot': 0,  # number of packets received at the DAGroot
-                'droppedFailedEnqueue': 0,  # dropped packets because failed enqueue them
-                'droppedDataFailedEnqueue': 0,  # dropped DATA packets because app failed enqueue them
-                # queue
-                'droppedQueueFull': 0,  # dropped packets because queue is full
-                # rpl
-                'rplTxDIO': 0,  # number of TX'ed DIOs
-                'rplRxDIO': 0,  # number of RX'ed DIOs
-                'rplTxDAO': 0,  # number of TX'ed DAOs
-                'rplRxDAO': 0,  # number of RX'ed DAOs
-                'rplChurnPrefParent': 0,  # number of time the mote changes preferred parent
-                'rplChurnRank': 0,  # number of time the mote changes rank
-                'rplChurnParentSet': 0,  # number of time the mote changes parent set
-                'droppedNoRoute': 0,  # packets dropped because no route (no preferred parent)
-                'droppedNoTxCells': 0,  # packets dropped because no TX cells
-                # 6top
-                '6topTxRelocatedCells': 0,  # number of time tx-triggered 6top relocates a single cell
-                '6topTxRelocatedBundles': 0,  # number of time tx-triggered 6top relocates a bundle
-                '6topRxRelocatedCells': 0,  # number of time rx-triggered 6top relocates a single cell
-                '6topTxAddReq': 0,  # number of 6P Add request transmitted
-                '6topTxAddResp': 0,  # number of 6P Add responses transmitted
-                '6topTxDelReq': 0,  # number of 6P del request transmitted
-                '6topTxDelResp': 0,  # number of 6P del responses transmitted
-                '6topRxAddReq': 0,  # number of 6P Add request received
-                '6topRxAddResp': 0,  # number of 6P Add responses received
-                '6topRxDelReq': 0,  # number of 6P Del request received
-                '6topRxDelResp': 0,  # number of 6P Del responses received
-                # tsch
-                'droppedMacRetries': 0,  # packets dropped because more than TSCH_MAXTXRETRIES MAC retries
-                'droppedDataMacRetries': 0,
-            # packets dropped because more than TSCH_MAXTXRETRIES MAC retries in a DATA packet
-                'tschTxEB': 0,  # number of TX'ed EBs
-                'tschRxEB': 0,  # number of RX'ed EBs
-            }
+        self.motestats = MOTESTATS_ZERO.copy()
 
     def _stats_incrementMoteStats(self, name):
         with self.dataLock:
@@ -4645,49 +4623,48 @@ class Mote(object):
 
         returnVal = None
         with self.dataLock:
-            for (ts, cell) in self.schedule.items():
-                if ts == ts_p and cell['ch'] == ch_p:
-                    returnVal = {
-                        'dir': cell['dir'],
-                        'neighbor': [node.id for node in cell['neighbor']] if type(cell['neighbor']) is list else cell[
-                            'neighbor'].id,
-                        'numTx': cell['numTx'],
-                        'numTxAck': cell['numTxAck'],
-                        'numRx': cell['numRx'],
-                    }
-                    break
+            cell = self.schedule.get(ts_p)
+            if cell is not None and cell.ch == ch_p:
+                returnVal = {
+                    'dir': cell.dir,
+                    'neighbor': [node.id for node in cell.neighbor] if type(cell.neighbor) is list else cell.neighbor.id,
+                    'numTx': cell.numTx,
+                    'numTxAck': cell.numTxAck,
+                    'numRx': cell.numRx,
+                }
         return returnVal
 
     def stats_sharedCellCollisionSignal(self):
-        asn = self.engine.getAsn()
-        ts = asn % self.settings.slotframeLength
-
-        assert self.schedule[ts]['dir'] == DIR_TXRX_SHARED
+        ts = self.engine.asn % self.settings.slotframeLength
 
         with self.dataLock:
-            self.schedule[ts]['sharedCellCollision'] = 1
+            cell = self.schedule[ts]
+            assert cell.dir == DIR_TXRX_SHARED
+            cell.sharedCellCollision = 1
 
     def stats_sharedCellSuccessSignal(self):
-        asn = self.engine.getAsn()
-        ts = asn % self.settings.slotframeLength
-
-        assert self.schedule[ts]['dir'] == DIR_TXRX_SHARED
+        ts = self.engine.asn % self.settings.slotframeLength
 
         with self.dataLock:
-            self.schedule[ts]['sharedCellSuccess'] = 1
+            cell = self.schedule[ts]
+            assert cell.dir == DIR_TXRX_SHARED
+            cell.sharedCellSuccess = 1
 
     def getSharedCellStats(self):
         returnVal = {}
         # gather statistics
         with self.dataLock:
-            for (ts, cell) in self.schedule.items():
-                if cell['dir'] == DIR_TXRX_SHARED:
-                    returnVal['sharedCellCollision_{0}_{1}'.format(ts, cell['ch'])] = cell['sharedCellCollision']
-                    returnVal['sharedCellSuccess_{0}_{1}'.format(ts, cell['ch'])] = cell['sharedCellSuccess']
-
-                    # reset the statistics
-                    cell['sharedCellCollision'] = 0
-                    cell['sharedCellSuccess'] = 0
+            for (ts, cell) in self._cellsByDir[DIR_TXRX_SHARED].iteritems():
+                keys = SHARED_CELL_STAT_KEYS.get((ts, cell.ch))
+                if keys is None:
+                    keys = ('sharedCellCollision_{0}_{1}'.format(ts, cell.ch), 'sharedCellSuccess_{0}_{1}'.format(ts, cell.ch))
+                    SHARED_CELL_STAT_KEYS[(ts, cell.ch)] = keys
+                returnVal[keys[0]] = cell.sharedCellCollision
+                returnVal[keys[1]] = cell.sharedCellSuccess
+
+                # reset the statistics
+                cell.sharedCellCollision = 0
+                cell.sharedCellSuccess = 0
 
         return returnVal
 
@@ -4695,60 +4672,61 @@ class Mote(object):
 
     def _stats_logQueueDelay(self, delay):
         with self.dataLock:
-            self.queuestats['delay'] += [delay]
+            self.queuestats['delaySum'] += delay
+            self.queuestats['delayNum'] += 1
 
     def _stats_getAveQueueDelay(self):
-        d = self.queuestats['delay']
-        return float(sum(d)) / len(d) if len(d) > 0 else 0
+        n = self.queuestats['delayNum']
+        return float(self.queuestats['delaySum']) / n if n > 0 else 0
 
     def _stats_resetQueueStats(self):
-        with self.dataLock:
-            self.queuestats = {
-                'delay': [],
-            }
+        self.queuestats = {
+            'delaySum': 0,
+            'delayNum': 0,
+        }
 
     # latency stats
 
     def _stats_logLatencyStat(self, latency):
         with self.dataLock:
-            self.packetLatencies += [latency]
+            self.packetLatencySum += latency
+            self.packetLatencyNum += 1
 
     def _stats_logSixTopLatencyStat(self, latency):
         with self.dataLock:
-            self.avgsixtopLatency += [latency]
+            self.sixtopLatencySum += latency
+            self.sixtopLatencyNum += 1
 
     def _stats_getAveLatency(self):
-        with self.dataLock:
-            d = self.packetLatencies
-            return float(sum(d)) / float(len(d)) if len(d) > 0 else 0
+        n = self.packetLatencyNum
+        return float(self.packetLatencySum) / float(n) if n > 0 else 0
 
     def _stats_getAveSixTopLatency(self):
-        with self.dataLock:
-            d = self.avgsixtopLatency
-            return float(sum(d)) / float(len(d)) if len(d) > 0 else 0
+        n = self.sixtopLatencyNum
+        return float(self.sixtopLatencySum) / float(n) if n > 0 else 0
 
     def _stats_resetLatencyStats(self):
-        with self.dataLock:
-            self.packetLatencies = []
+        self.packetLatencySum = 0
+        self.packetLatencyNum = 0
 
     def _stats_resetSixTopLatencyStats(self):
-        with self.dataLock:
-            self.avgsixtopLatency = []
+        self.sixtopLatencySum = 0
+        self.sixtopLatencyNum = 0
 
     # hops stats
 
     def _stats_logHopsStat(self, hops):
         with self.dataLock:
-            self.packetHops += [hops]
+            self.packetHopsSum += hops
+            self.packetHopsNum += 1
 
     def _stats_getAveHops(self):
-        with self.dataLock:
-            d = self.packetHops
-            return float(sum(d)) / float(len(d)) if len(d) > 0 else 0
+        n = self.packetHopsNum
+        return float(self.packetHopsSum) / float(n) if n > 0 else 0
 
     def _stats_resetHopsStats(self):
-        with self.dataLock:
-            self.packetHops = []
+        self.packetHopsSum = 0
+        self.packetHopsNum = 0
 
     # radio stats
 
@@ -4760,36 +4738,18 @@ class Mote(object):
         return self.radiostats[name]
 
     def _stats_resetRadioStats(self):
-        with self.dataLock:
-            self.radiostats = {
-                'probableCollisions': 0,  # number of packets that can collide with another packets
-            }
+        self.radiostats = {
+            'probableCollisions': 0,  # number of packets that can collide with another packets
+        }
 
     # ===== log
 
     def _log(self, severity, template, params=()):
 
-        if severity == DEBUG:
-            if not log.isEnabledFor(logging.DEBUG):
-                return
-            logfunc = log.debug
-        elif severity == INFO:
-            if not log.isEnabledFor(logging.INFO):
-                return
-            logfunc = log.info
-        elif severity == WARNING:
-            if not log.isEnabledFor(logging.WARNING):
-                return
-            logfunc = log.warning
-        elif severity == ERROR:
-            if not log.isEnabledFor(logging.ERROR):
-                return
-            logfunc = log.error
-        else:
+        level = LOG_LEVELS.get(severity)
+        if level is None:
             raise NotImplementedError()
+        if not log.isEnabledFor(level):
+            return
 
-        output = []
-        output += ['[ASN={0:>6} id={1:>4}] '.format(self.engine.getAsn(), self.id)]
-        output += [template.format(*params)]
-        output = ''.join(output)
-        logfunc(output)
+        log.log(level, '[ASN=%6s id=%4s] ' % (self.engine.asn, self.id) + template.format(*params))
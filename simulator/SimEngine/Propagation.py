@@ -121,16 +121,16 @@ class PropagationCreator(object):
     def startRx(self,mote,channel, aggregatedInfo=None):
         """ add a mote as listener on a channel"""
         with self.dataLock:
-            self.receivers += [{
+            self.receivers.append({
                 'mote':                mote,
                 'channel':             channel,
                 'aggregatedInfo':      aggregatedInfo,
-            }]
+            })
 
     def startTx(self,channel,type,code,smac,dmac,srcIp,dstIp,srcRoute, payload, aggregatedInfo=None):
         """ add a mote as using a channel for tx"""
         with self.dataLock:
-            self.transmissions  += [{
+            self.transmissions.append({
                 'channel':             channel,
                 'type':                type,
                 'code':                code,
@@ -141,7 +141,7 @@ class PropagationCreator(object):
                 'sourceRoute':         srcRoute,
                 'payload':             payload,
                 'aggregatedInfo':      aggregatedInfo
-            }]
+            })
 
     @abstractmethod
     def propagate(self):
@@ -171,14 +171,14 @@ class PropagationFromModel(PropagationCreator):
             ts    = asn % self.settings.slotframeLength
 
             for receiver in self.storedReceivers:
-                self.receivers += [{
+                self.receivers.append({
                     'mote':                receiver['mote'], \
                     'channel':             receiver['channel'], \
                     'aggregatedInfo':      receiver['aggregatedInfo']
-                }]
+                })
 
             for transmitter in self.storedTransmissions:
-                self.transmissions += [{
+                self.transmissions.append({
                     'channel': transmitter['channel'],
                     'type': transmitter['type'],
                     'code': transmitter['code'],
@@ -189,7 +189,7 @@ class PropagationFromModel(PropagationCreator):
                     'sourceRoute': transmitter['sourceRoute'],
                     'payload': transmitter['payload'],
                     'aggregatedInfo': transmitter['aggregatedInfo']
-                }]
+                })
 
             self.storedReceivers = [] # clear the stored receivers
             self.storedTransmissions = [] # clear the stored transmissions
@@ -270,7 +270,7 @@ class PropagationFromModel(PropagationCreator):
                                         allInterferers = interferers[:]
                                         for iferer in self.receivers[i]['aggregatedInfo']['interferers']:
                                             if iferer not in allInterferers:
-                                                allInterferers += [iferer]
+                                                allInterferers.append(iferer)
 
                                         # if len(allInterferers) > 0:
                                         #     print 'ALL INTEFERERS AT TIMESLOT %d: %s' % (ts, str(allInterferers))
@@ -396,10 +396,10 @@ class PropagationFromModel(PropagationCreator):
 
                                     if self.receivers[i]['aggregatedInfo']['endSlot'] == ts and self.receivers[i]['aggregatedInfo']['success']:
 
-                                        if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
+                                        if self.engine.inExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
                                             self.receivers[i]['mote'].totalPropagationData += 1
 
-                                        if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
+                                        if self.engine.inExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
                                             if hadInterferers:
                                                 self.receivers[i]['mote'].hadInterferers += 1
                                             if len(allTXInterferers) > 0:
@@ -434,7 +434,7 @@ class PropagationFromModel(PropagationCreator):
                                                 payload=transmission['payload']
                                             )
 
-                                            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
+                                            if self.engine.inExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
                                                 self.receivers[i]['mote'].successPropagationData += 1
 
                                             # this mote stops listening
@@ -444,7 +444,7 @@ class PropagationFromModel(PropagationCreator):
                                             # packet is NOT received correctly
                                             self.receivers[i]['mote'].radio_rxDone()
 
-                                            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
+                                            if self.engine.inExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
                                                 if len(allInterferers) == 0 and pdrNoInterference < failure and pdrWithInterference < failure:
                                                     # when the propagation would have failed due to the propagation model and there are no interferers, this is signal loss
                                                     self.receivers[i]['mote'].signalFailures += 1
@@ -468,7 +468,7 @@ class PropagationFromModel(PropagationCreator):
                                         # the node was locked in an interfering signal in the first slot of the transmission slots
                                         self.receivers[i]['mote'].radio_rxDone()
 
-                                        if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn <= self.engine.asnEndExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
+                                        if self.engine.inExperiment and transmission['type'] == Mote.APP_TYPE_DATA:
                                             self.receivers[i]['mote'].interferenceLockFailures += 1
 
                                         del self.receivers[i]
@@ -477,13 +477,13 @@ class PropagationFromModel(PropagationCreator):
                                         # keep the interferers for the end slot
                                         for iferer in interferers:
                                             if iferer not in self.receivers[i]['aggregatedInfo']['interferers']:
-                                                self.receivers[i]['aggregatedInfo']['interferers'] += [iferer]
+                                                self.receivers[i]['aggregatedInfo']['interferers'].append(iferer)
 
-                                        self.storedReceivers += [{
+                                        self.storedReceivers.append({
                                             'mote': self.receivers[i]['mote'], \
                                             'channel': self.receivers[i]['channel'], \
                                             'aggregatedInfo': self.receivers[i]['aggregatedInfo'], \
-                                            }]
+                                            })
                                         # this mote stops listening
                                         del self.receivers[i]
                                 else:
@@ -518,11 +518,11 @@ class PropagationFromModel(PropagationCreator):
                                     elif ts == self.receivers[i]['aggregatedInfo']['startSlot']:
                                         # store this for the end of the transmission
                                         self.receivers[i]['aggregatedInfo']['success'] = False
-                                        self.storedReceivers += [{
+                                        self.storedReceivers.append({
                                             'mote': self.receivers[i]['mote'], \
                                             'channel': self.receivers[i]['channel'], \
                                             'aggregatedInfo': self.receivers[i]['aggregatedInfo'], \
-                                            }]
+                                            })
                                     del self.receivers[i]
                         else:
                             # this packet is NOT destined for this mote
@@ -548,17 +548,17 @@ class PropagationFromModel(PropagationCreator):
                 if ts == r['aggregatedInfo']['endSlot']:
                     r['mote'].radio_rxDone()
                 if ts < r['aggregatedInfo']['endSlot']:
-                    self.storedReceivers += [{
+                    self.storedReceivers.append({
                             'mote': r['mote'], \
                             'channel': r['channel'], \
                             'aggregatedInfo': r['aggregatedInfo'], \
-                        }]
+                        })
 
             # in case of slot aggregation, get all transmissions that are not done
             for transmission in self.transmissions:
                 assert transmission['aggregatedInfo'] is not None
                 if ts < transmission['aggregatedInfo']['endSlot']:
-                    self.storedTransmissions += [{
+                    self.storedTransmissions.append({
                         'channel': transmission['channel'],
                         'type': transmission['type'],
                         'code': transmission['code'],
@@ -569,7 +569,7 @@ class PropagationFromModel(PropagationCreator):
                         'sourceRoute': transmission['sourceRoute'],
                         'payload': transmission['payload'],
                         'aggregatedInfo': transmission['aggregatedInfo']
-                    }]
+                    })
 
             # clear all outstanding transmissions
             self.transmissions              = []
@@ -609,7 +609,7 @@ class PropagationFromModel(PropagationCreator):
         # elif SimSettings.SimSettings().individualModulations == 1:
 
         noise = Modulation.Modulation().receiverNoise
-        signal = _dBmTomW(source.getRSSI(destination))
+        signal = source.RSSImW[destination.id]
         if signal < noise:
             # RSSI has not to be below noise level. If this happens, return very low SINR (-10.0dB)
             return -10.0
@@ -618,7 +618,7 @@ class PropagationFromModel(PropagationCreator):
         interfererCount = 0
         for interferer in interferers:
             # print 'Interferer %d: %.15f dBm' % (interfererCount, interferer.getRSSI(destination))
-            interference = _dBmTomW(interferer['mote'].getRSSI(destination))
+            interference = interferer['mote'].RSSImW[destination.id]
             # print(interferers)
             # print('interference from interferer {0} to {1} = {2}'.format(interferer['mote'].id, destination.id, interferer['mote'].getRSSI(destination)))
             # print(interference)
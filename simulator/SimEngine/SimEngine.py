@@ -101,7 +101,9 @@ class SimEngine(threading.Thread):
         self.genMobility = random.Random()
         self.genMobility.seed(self.settings.seed)
         self.propagation                    = Propagation.Propagation()
+        self.txCellOccupancy                = {} # motes with a TX cell, indexed by (ts, ch)
         self.motes                          = [Mote.Mote(id) for id in range(self.settings.numMotes)]
+        self.moteById                       = dict((m.id, m) for m in self.motes)
 
         self.ilp_topology                   = None
 
@@ -223,6 +225,10 @@ class SimEngine(threading.Thread):
         # Not valid values. Will be set by the last mote that converged.
         self.asnInitExperiment = 999999999
         self.asnEndExperiment = 999999999
+        # whether the current ASN is in the experiment window (only when converging first), updated every ASN
+        self.inExperiment = False
+        # whether the current ASN counts for the statistics: inside the experiment window, or always when not converging first
+        self.countStats = not self.settings.convergeFirst
 
         # for the ILP
         self.ILPTerminationDelay = 999999999
@@ -279,10 +285,7 @@ class SimEngine(threading.Thread):
     #======================== thread ==========================================
 
     def getMote(self, id):
-        for m in self.motes:
-            if m.id == id:
-                return m
-        assert False
+        return self.moteById[id]
 
     def extendJSONWithTopology(self, exp_file, name_exp):
         ''' Write the topology to a file '''
@@ -872,6 +875,8 @@ class SimEngine(threading.Thread):
 
                 # update the current ASN
                 self.asn = self.events[0][0]
+                self.inExperiment = self.settings.convergeFirst and self.asnInitExperiment <= self.asn <= self.asnEndExperiment
+                self.countStats = self.inExperiment or not self.settings.convergeFirst
 
                 if self.settings.ilpfile is None:
                     interval = 15
@@ -954,32 +959,24 @@ class SimEngine(threading.Thread):
         if placement:
             margin = 0.02
 
-        inSquare = False  # total area
-        insideObstacle1 = False  # rectangle 1
-        insideObstacle2 = False  # rectangle 2
-        insideObstacle3 = False  # rectangle 1
-        insideObstacle4 = False  # rectangle 2
+        # total area
         if countSquare:
-            if (xcoord < self.settings.squareSide and ycoord < self.settings.squareSide) and (
-                    xcoord > 0 and ycoord > 0):
-                inSquare = True
-        else:
-            inSquare = True
+            if not ((xcoord < self.settings.squareSide and ycoord < self.settings.squareSide) and (
+                    xcoord > 0 and ycoord > 0)):
+                return False
 
+        # rectangle 1 to 4, stop at the first obstacle the position is in
         if (xcoord < (self.rect1[2] + margin)) and (ycoord > (self.rect1[1] - margin) and (ycoord < (self.rect1[3] + margin))):
-            insideObstacle1 = True
+            return False
         if (xcoord > (self.rect2[0] - margin)) and (ycoord > (self.rect2[1] - margin) and (ycoord < (self.rect2[3] + margin))):
-            insideObstacle2 = True
+            return False
         if (xcoord < (self.rect3[2] + margin)) and (ycoord > (self.rect3[1] - margin) and (ycoord < (self.rect3[3] + margin))):
-            insideObstacle3 = True
+            return False
         if (xcoord > (self.rect4[0] - margin)) and (ycoord > (self.rect4[1] - margin) and (ycoord < (self.rect4[3] + margin))):
-            insideObstacle4 = True
-
-        if inSquare and not insideObstacle1 and not insideObstacle2 and not insideObstacle3 and not insideObstacle4:
-            return True
-        else:
             return False
 
+        return True
+
     #=== scheduling
 
     def scheduleAtStart(self,cb):
@@ -107,31 +107,40 @@ class SimStats(object):
         self.slotTime = 0.0
         self.airTime = 0.0
 
+        # the same for every mote in this cycle
+        slotframeLength = self.settings.slotframeLength
+        modulation = Modulation.Modulation()
+        modulationConfig = self.settings.modulationConfig
+        allowedModulations = modulation.allowedModulations[modulationConfig]
+        # == self.engine.asnEndExperiment will be handled in EndCycle
+        inExperiment = self.settings.convergeFirst and self.engine.asnInitExperiment <= self.engine.asn < self.engine.asnEndExperiment
+        if inExperiment:
+            maxMinimalCell = (self.settings.nrMinimalCells * (modulation.modulationSlots[modulationConfig][modulation.minimalCellModulation[modulationConfig]])) - 1
+            slotDurationMs = self.settings.slotDuration * 1000.0
+
         # add the number of SLEEP slots
         for mote in self.engine.motes:
-            if self.settings.convergeFirst and self.engine.asn >= self.engine.asnInitExperiment and self.engine.asn < self.engine.asnEndExperiment: # == self.engine.asnEndExperiment will be handled in EndCycle
+            if inExperiment:
 
                 if not mote.dagRoot:
                     timeUsed = 0.0
-                    maxMinimalCell = (self.settings.nrMinimalCells * (Modulation.Modulation().modulationSlots[self.settings.modulationConfig][Modulation.Modulation().minimalCellModulation[self.settings.modulationConfig]])) - 1
-                    for (ts, cell) in mote.schedule.items():
-                        # calculate the schedule usage
-                        if maxMinimalCell < ts and (cell['dir'] == Mote.DIR_TX or (cell['dir'] == Mote.DIR_TXRX_SHARED and cell['neighbor'] == mote.preferredParent)):
-                            listIndex = ts + self.settings.slotframeLength * cell['ch']
+                    preferredParent = mote.preferredParent
+                    for (ts, cell) in mote.schedule.iteritems():
+                        # do not count minimal cells and only look at TX or SHARED to preferred parent
+                        if maxMinimalCell < ts and (cell.dir == Mote.DIR_TX or (cell.dir == Mote.DIR_TXRX_SHARED and cell.neighbor == preferredParent)):
+                            # calculate the schedule usage
+                            listIndex = ts + slotframeLength * cell.ch
                             self.usedSchedule[listIndex] += 1
 
-                        # calculate the total usage in slottime
-                        # do not count minimal cells and only look at TX or SHARED to preferred parent
-                        # ! this can start introducing problems when there are parent changes and there are more shared cells to old parents fore examples: in that case it won't be exactly accurate
-                        if maxMinimalCell < ts and (cell['dir'] == Mote.DIR_TX or (cell['dir'] == Mote.DIR_TXRX_SHARED and cell['neighbor'] == mote.preferredParent)):
-                            self.slotTime += (self.settings.slotDuration * 1000.0)
+                            # calculate the total usage in slottime
+                            # ! this can start introducing problems when there are parent changes and there are more shared cells to old parents fore examples: in that case it won't be exactly accurate
+                            self.slotTime += slotDurationMs
 
-                        # calculate the total airtime in slottime
-                        # do not count minimal cells and only look at TX or SHARED
-                        # only look for ts and make your calculation based on the number of parentTSs and the modulation type
-                        if maxMinimalCell < ts and cell['parentTs'] == ts and (cell['dir'] == Mote.DIR_TX or (cell['dir'] == Mote.DIR_TXRX_SHARED and cell['neighbor'] == mote.preferredParent)):
-                            # returns in milliseconds
-                            self.airTime += Modulation.Modulation().calculateTXLength(self.settings.packetSize, cell['modulation'])
+                            # calculate the total airtime in slottime
+                            # only look for ts and make your calculation based on the number of parentTSs and the modulation type
+                            if cell.parentTs == ts:
+                                # returns in milliseconds
+                                self.airTime += modulation.calculateTXLength(self.settings.packetSize, cell.modulation)
 
                 # print 'End Cycle'
                 # for (ts, cell) in mote.schedule.iteritems():
@@ -216,15 +225,13 @@ class SimStats(object):
             elif not self.settings.convergeFirst:
                 mote.nrSleep += self.settings.slotframeLength - len(mote.schedule)
 
-            # copy all the modulation states in the total consumption states
-            for modulation in Modulation.Modulation().allowedModulations[self.settings.modulationConfig]:
-                for state, state_dict in mote.consumption.iteritems():
-                    mote.totalConsumption[state][modulation] += mote.consumption[state][modulation]
-
-            # reset the states per modulation
-            for modulation in Modulation.Modulation().allowedModulations[self.settings.modulationConfig]:
-                for state, state_dict in mote.consumption.iteritems():
-                    mote.consumption[state][modulation] = 0
+            # copy all the modulation states in the total consumption states, and reset them
+            totalConsumption = mote.totalConsumption
+            for state, state_dict in mote.consumption.iteritems():
+                totalState = totalConsumption[state]
+                for m in allowedModulations:
+                    totalState[m] += state_dict[m]
+                    state_dict[m] = 0
 
             # print 'Mote %d, %d/101. SLEEP consumption %.4f' % (mote.id, len(mote.schedule), consumption)
         cycle = int(self.engine.getAsn()/self.settings.slotframeLength)
@@ -388,7 +395,7 @@ class SimStats(object):
         numBootstrappedMotes = 0
         dagRoot = None
         for mote in self.engine.motes:
-            if len(mote.getTxCells()) > 0:
+            if mote.getNumTxCells() > 0:
                 numBootstrappedMotes += 1
             if mote.dagRoot is True:
                 dagRoot = mote
@@ -405,8 +412,8 @@ class SimStats(object):
         txCells = []
         for mote in self.engine.motes:
             for (ts,cell) in mote.schedule.items():
-                (ts,ch) = (ts,cell['ch'])
-                if cell['dir'] == Mote.DIR_TX:
+                (ts,ch) = (ts,cell.ch)
+                if cell.dir == Mote.DIR_TX:
                     if (ts,ch) in txCells:
                         scheduleCollisions += 1
                     else:
@@ -416,9 +423,9 @@ class SimStats(object):
         txLinks = {}
         for mote in self.engine.motes:
             for (ts,cell) in mote.schedule.items():
-                if cell['dir'] == Mote.DIR_TX:
-                    (ts,ch) = (ts,cell['ch'])
-                    (tx,rx) = (mote,cell['neighbor'])
+                if cell.dir == Mote.DIR_TX:
+                    (ts,ch) = (ts,cell.ch)
+                    (tx,rx) = (mote,cell.neighbor)
                     if (ts,ch) in txLinks:
                         txLinks[(ts,ch)] += [(tx,rx)]
                     else:
@@ -449,7 +456,7 @@ class SimStats(object):
                 returnVal    = sharedCellStats
             else:
                 for k in returnVal.keys():
-                    if k in sharedCellStats.keys():
+                    if k in sharedCellStats:
                         returnVal[k] += sharedCellStats[k]
                     else:
                         returnVal[k] += 0
@@ -780,10 +780,9 @@ class LinearTopology(TopologyCreator):
 
         for mote in self.motes:
 
-            # clear RSSI and PDR table; we may need clearRSSI and clear PDR
-            # methods
+            # clear RSSI and PDR table; we may need a clearRSSI method
             mote.RSSI = {}
-            mote.PDR = {}
+            mote.clearPDR()
 
             for neighbor in self.motes:
                 if mote == neighbor:
@@ -938,9 +937,9 @@ class TwoBranchTopology(TopologyCreator):
                 m.y = 0.03
 
         for mote in self.motes:
-            # clear RSSI and PDR table; we may need clearRSSI and clearPDR methods
+            # clear RSSI and PDR table; we may need a clearRSSI method
             mote.RSSI = {}
-            mote.PDR = {}
+            mote.clearPDR()
 
             for neighbor in self.motes:
                 if mote == neighbor:
@@ -65,10 +65,10 @@ class eLLSF(object):
         blockedCells = []
         for n in self.mote.sixtopStates.keys():
             if n != neighbor.id:
-                if 'tx' in self.mote.sixtopStates[n] and len(self.mote.sixtopStates[n]['tx']['blockedCells'])>0:
-                    blockedCells += self.mote.sixtopStates[n]['tx']['blockedCells']
-                if 'rx' in self.mote.sixtopStates[n] and len(self.mote.sixtopStates[n]['rx']['blockedCells'])>0:
-                    blockedCells += self.mote.sixtopStates[n]['rx']['blockedCells']
+                if len(self.mote.sixtopStates[n].txBlockedCells)>0:
+                    blockedCells += self.mote.sixtopStates[n].txBlockedCells
+                if len(self.mote.sixtopStates[n].rxBlockedCells)>0:
+                    blockedCells += self.mote.sixtopStates[n].rxBlockedCells
 
         #convert blocked cells into ts
         tsBlocked=[]
@@ -91,11 +91,11 @@ class eLLSF(object):
         rxTimeslots = OrderedDict()
         if neighbor is self.mote.preferredParent:
             for ts, cell in self.mote.schedule.iteritems():
-                if ts in self.ELLSF_TIMESLOTS and cell['dir'] == Mote.DIR_TXRX_SHARED and cell['neighbor'] is not self.mote.preferredParent and cell['neighbor'] is not self.mote.oldPreferredParent:
-                    if cell['neighbor'] in rxTimeslots:
-                        rxTimeslots[cell['neighbor']].append(ts)
+                if ts in self.ELLSF_TIMESLOTS and cell.dir == Mote.DIR_TXRX_SHARED and cell.neighbor is not self.mote.preferredParent and cell.neighbor is not self.mote.oldPreferredParent:
+                    if cell.neighbor in rxTimeslots:
+                        rxTimeslots[cell.neighbor].append(ts)
                     else:
-                        rxTimeslots[cell['neighbor']] = [ts]
+                        rxTimeslots[cell.neighbor] = [ts]
         else: # only allow reservations to preferred parent
             assert False
 
@@ -179,9 +179,9 @@ class eLLSF(object):
     def _ellsf_find_tx_slots(self):
         txTimeslots = []
         for ts, cell in self.mote.schedule.iteritems():
-            if ts in self.ELLSF_TIMESLOTS and cell['dir'] == Mote.DIR_TXRX_SHARED and \
-                    cell['neighbor'] is self.mote.preferredParent and \
-                    cell['neighbor'] is not self.mote.oldPreferredParent:
+            if ts in self.ELLSF_TIMESLOTS and cell.dir == Mote.DIR_TXRX_SHARED and \
+                    cell.neighbor is self.mote.preferredParent and \
+                    cell.neighbor is not self.mote.oldPreferredParent:
                 txTimeslots.append(ts)
         return txTimeslots
 
@@ -207,10 +207,10 @@ class eLLSF(object):
         blockedCells = []
         for n in self.mote.sixtopStates.keys():
             if n!=neighbor.id:
-                if 'rx' in self.mote.sixtopStates[n] and len(self.mote.sixtopStates[n]['rx']['blockedCells'])>0:
-                    blockedCells+=self.mote.sixtopStates[n]['rx']['blockedCells']
-                if 'tx' in self.mote.sixtopStates[n] and len(self.mote.sixtopStates[n]['tx']['blockedCells'])>0:
-                    blockedCells+=self.mote.sixtopStates[n]['tx']['blockedCells']
+                if len(self.mote.sixtopStates[n].rxBlockedCells)>0:
+                    blockedCells+=self.mote.sixtopStates[n].rxBlockedCells
+                if len(self.mote.sixtopStates[n].txBlockedCells)>0:
+                    blockedCells+=self.mote.sixtopStates[n].txBlockedCells
                     
         #convert blocked cells into ts
         tsBlocked=[]
@@ -280,7 +280,7 @@ class eLLSF(object):
             returnCode = Mote.IANA_6TOP_RC_SUCCESS # enough resources
 
         #set blockCells for this 6top operation
-        self.mote.sixtopStates[neighbor.id]['rx']['blockedCells'] = newCellList
+        self.mote.sixtopStates[neighbor.id].rxBlockedCells = newCellList
 
         return newCellList, returnCode
     
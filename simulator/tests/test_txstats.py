@@ -0,0 +1,119 @@
+"""
+\brief Tests for the per-neighbor TX counters of a mote.
+"""
+
+import os
+import sys
+import json
+import math
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..'))
+sys.path.insert(0, os.path.join(here, '..', 'bin'))
+
+import pytest
+
+import runSim
+from SimEngine import SimEngine, SimSettings, Mote
+
+# root in the middle of the (default) 5 km square, mote 2 reaches the root through mote 1
+ILP_CONFIGURATION = {
+    'simulationTopology': {
+        '0': {'x': 2.5, 'y': 2.5},
+        '1': {'x': 2.5, 'y': 2.53},
+        '2': {'x': 2.5, 'y': 2.56},
+    },
+}
+# bonded cells of 3 slots
+ILP_SCHEDULE = {
+    'parents': {'1': 0, '2': 1},
+    'schedule': {
+        '1': {
+            '0': {'0': {'mcs': 'QPSK_FEC_1_2', 'slots': 3}},
+            '3': {'1': {'mcs': 'QPSK_FEC_1_2', 'slots': 3}},
+        },
+        '2': {
+            '6': {'0': {'mcs': 'QPSK_FEC_1_2', 'slots': 3}},
+        },
+    },
+}
+
+
+@pytest.fixture
+def engine(tmpdir, monkeypatch):
+    """ runs a short simulation of an ILP schedule with bonded cells """
+
+    ilpfile = tmpdir.join('ilp.json')
+    ilpfile.write(json.dumps(ILP_CONFIGURATION))
+    ilpschedule = tmpdir.join('ilp-schedule.json')
+    ilpschedule.write(json.dumps(ILP_SCHEDULE))
+
+    # the default options of runSim, the modulation files are looked up relative to bin/
+    monkeypatch.setattr(sys, 'argv', ['runSim.py'])
+    monkeypatch.chdir(os.path.join(here, '..', 'bin'))
+    options = runSim.parseCliOptions()
+    options.update(
+        numMotes=3,
+        numCyclesPerRun=200,
+        settlingTime=1,
+        slotframeLength=12,
+        slotDuration=0.01,
+        numChans=3,
+        nrMinimalCells=0,
+        individualModulations=1,
+        modulationConfig='MCS234s10ms',
+        modulationFile='modulation_stable_mcs2.json',
+        measuredData=1,
+        subGHz=1,
+        topology='random',
+        changeParent=0,
+        pkPeriodVar=0,
+        sf='ilp',
+        trafficGenerator='ilp',
+        ilpfile=str(ilpfile),
+        ilpschedule=str(ilpschedule),
+        json=str(tmpdir.join('exp.json')),
+        simDataDir=str(tmpdir),
+    )
+
+    settings = SimSettings.SimSettings(cpuID=0, runNum=0, **options)
+    simengine = SimEngine.SimEngine(cpuID=0, runNum=0)
+    simengine.run()
+
+    yield simengine
+
+    simengine.destroy()
+    settings.destroy()
+
+
+def _scanETX(mote, neighbor):
+    """ ETX as _estimateETX computed it from all the cells of the schedule """
+    numTx = Mote.NUM_SUFFICIENT_TX
+    numTxAck = math.floor(mote.getPDR(neighbor) * numTx)
+    for cell in mote.schedule.values():
+        if cell.neighbor == neighbor and (cell.dir == Mote.DIR_TX or cell.dir == Mote.DIR_TXRX_SHARED):
+            numTx += cell.numTx
+            numTxAck += cell.numTxAck
+    if not numTxAck:
+        return
+    return float(numTx) / float(numTxAck)
+
+
+def test_removeBondedCells_keepsTxStatsInSync(engine):
+    mote = engine.getMote(1)
+    parent = mote.preferredParent
+
+    txCells = sorted(ts for (ts, cell) in mote.schedule.items() if cell.dir == Mote.DIR_TX)
+    assert txCells == [0, 1, 2, 3, 4, 5]
+    # the ACKs are counted on the last slot of a bonded cell, which has no transmissions of its own
+    assert mote.schedule[0].numTx > 0 and mote.schedule[0].numTxAck == 0
+    assert mote.schedule[2].numTx == 0 and mote.schedule[2].numTxAck > 0
+    assert mote._estimateETX(parent) == _scanETX(mote, parent)
+
+    # remove the second bonded cell, then the first one
+    mote._tsch_removeCells(parent, [3, 4, 5])
+    assert mote._estimateETX(parent) == _scanETX(mote, parent)
+
+    mote._tsch_removeCells(parent, [0, 1, 2])
+    assert mote._estimateETX(parent) == _scanETX(mote, parent)
+    assert mote._txStatsPerNeigh[parent] == [0, 0]